@@ -1,14 +1,43 @@
 #!/usr/bin/env python3
 
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 import connexion
 
 from swagger_server import encoder
+from swagger_server.spec import cargar_spec
 import os
 
+
+def configurar_logging():
+    """
+    Configura el logger raíz para escribir a través de una cola.
+
+    Los hilos que atienden peticiones solo encolan el registro; un hilo
+    dedicado (QueueListener) hace la escritura a stderr, de modo que la E/S
+    de logging no bloquea ni serializa las peticiones.
+    """
+    cola = queue.SimpleQueue()
+    salida = logging.StreamHandler()
+    salida.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(cola, salida, respect_handler_level=True)
+
+    raiz = logging.getLogger()
+    raiz.addHandler(QueueHandler(cola))
+    raiz.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+    listener.start()
+    atexit.register(listener.stop)
+
+
 def main():
+    configurar_logging()
     app = connexion.App(__name__, specification_dir='./swagger/')
     app.app.json_encoder = encoder.JSONEncoder
-    app.add_api('swagger.yaml', arguments={'title': 'Tienda y Pasarela de Pago (TPP)'}, pythonic_params=True)
+    app.add_api(cargar_spec(), pythonic_params=True)
     app.run(host=os.environ.get('HOST', '0.0.0.0'), port=int(os.environ.get('PORT', 8082)))
 
 
@@ -0,0 +1,92 @@
+"""
+Caché en memoria del proceso.
+
+Este módulo proporciona una caché clave/valor sencilla, segura entre hilos,
+con tamaño acotado (expulsión LRU) y expiración opcional por entrada (TTL).
+Se utiliza para evitar consultas repetidas a otros microservicios (TyA)
+cuando los datos cambian con poca frecuencia.
+
+Características:
+    - Tamaño máximo configurable: al superarlo se expulsa la entrada usada
+      hace más tiempo, de modo que la memoria nunca crece sin límite
+    - TTL opcional: las entradas caducadas se tratan como ausentes
+    - Protegida con un Lock para usarse desde varios hilos (servidor WSGI
+      multihilo y pool de peticiones a TyA)
+
+Note:
+    La caché es local a cada proceso. Con varios workers cada uno mantiene
+    su propia copia, lo que es aceptable para datos de catálogo.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+_AUSENTE = object()
+
+
+class TTLCache(object):
+    """
+    Caché LRU acotada con expiración opcional por entrada.
+
+    Attributes:
+        maxsize (int): Número máximo de entradas almacenadas.
+        ttl (float, optional): Segundos de vida de cada entrada. None para
+            que las entradas no caduquen (LRU puro).
+
+    Examples:
+        >>> cache = TTLCache(maxsize=2, ttl=60)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+        >>> cache.get("b") is None
+        True
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Obtiene el valor asociado a key si existe y no ha caducado.
+
+        Returns:
+            El valor almacenado, o default si no existe o ha caducado.
+        """
+        with self._lock:
+            entrada = self._datos.get(key, _AUSENTE)
+            if entrada is _AUSENTE:
+                return default
+            expira, valor = entrada
+            if expira is not None and expira <= time.monotonic():
+                del self._datos[key]
+                return default
+            self._datos.move_to_end(key)
+            return valor
+
+    def set(self, key, value):
+        """Almacena value bajo key, expulsando la entrada más antigua si hace falta."""
+        expira = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._datos[key] = (expira, value)
+            self._datos.move_to_end(key)
+            while len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Elimina key de la caché y retorna su valor (o default)."""
+        with self._lock:
+            entrada = self._datos.pop(key, _AUSENTE)
+        return default if entrada is _AUSENTE else entrada[1]
+
+    def clear(self):
+        """Vacía la caché."""
+        with self._lock:
+            self._datos.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._datos)
@@ -24,17 +24,103 @@ Base de datos:
         - MerchCarrito (idMerch, idUsuario, unidades)
 """
 
+import hashlib
+
 import connexion
+import orjson
 import six
 import requests
+from flask import Response
 
 from swagger_server.models.cart_body import CartBody  # noqa: E501
 from swagger_server.models.error import Error  # noqa: E501
 from swagger_server.models.product import Product  # noqa: E501
 from swagger_server import util
+from swagger_server.cache import TTLCache
 from swagger_server.dbconx import dbConectar, dbDesconectar
-from swagger_server.controllers.config import TYA_SERVICE_URL
+from swagger_server.controllers.config import TYA_SERVICE_URL, PRODUCT_CACHE_TTL, PRODUCT_CACHE_SIZE
+
+# Productos ya construidos a partir de TyA, por (tipo, id). Product es
+# inmutable (rechaza cualquier asignación tras construirse), así que las
+# instancias se comparten entre peticiones. Solo contiene metadatos públicos
+# del catálogo.
+_CACHE_PRODUCTOS = TTLCache(maxsize=PRODUCT_CACHE_SIZE, ttl=PRODUCT_CACHE_TTL)
+
+# Productos por hash del cuerpo de la respuesta de TyA. Al ir por contenido
+# las entradas nunca quedan obsoletas: basta con acotar el tamaño (LRU).
+_CACHE_RESPUESTAS = TTLCache(maxsize=2048)
+
+
+def _producto_desde_tya(construir, contenido):
+    """
+    Construye el Product de una respuesta de TyA, reutilizando el ya creado si
+    el contenido es idéntico.
+
+    La clave es el hash BLAKE2b del cuerpo de la respuesta: TyA devuelve los
+    mismos bytes para un producto que no ha cambiado, así que se evita volver
+    a parsear el JSON y a construir el modelo (Product es inmutable).
 
+    Args:
+        construir (callable): _producto_cancion, _producto_album o _producto_merch.
+        contenido (bytes): Cuerpo de la respuesta de TyA.
+
+    Returns:
+        Product: Producto construido o reutilizado.
+    """
+    clave = (construir.__name__, hashlib.blake2b(contenido, digest_size=16).digest())
+    producto = _CACHE_RESPUESTAS.get(clave)
+    if producto is None:
+        producto = construir(orjson.loads(contenido))
+        _CACHE_RESPUESTAS.set(clave, producto)
+    return producto
+
+
+def _producto_cancion(producto_data):
+    """Construye el Product de una canción a partir de su JSON de TyA."""
+    return Product(
+        song_id=producto_data.get("songId"),
+        name=producto_data.get("title"),
+        description=producto_data.get("description"),
+        price=producto_data.get("price"),
+        artist=producto_data.get("artistId", 0),
+        colaborators=producto_data.get("collaborators", []),
+        genre=producto_data.get("genres", [0])[0] if producto_data.get("genres") else 0,
+        duration=producto_data.get("duration", 0),
+        cover=producto_data.get("cover"),
+        release_date=producto_data.get("releaseDate"),
+        album_id=producto_data.get("albumId"),
+    )
+
+
+def _producto_album(producto_data):
+    """Construye el Product de un álbum a partir de su JSON de TyA."""
+    return Product(
+        album_id=producto_data.get("albumId"),
+        name=producto_data.get("title"),
+        description=producto_data.get("description"),
+        price=producto_data.get("price"),
+        artist=producto_data.get("artistId", 0),
+        colaborators=producto_data.get("collaborators", []),
+        genre=producto_data.get("genres", [0])[0] if producto_data.get("genres") else 0,
+        song_list=producto_data.get("songs", []),
+        cover=producto_data.get("cover"),
+        release_date=producto_data.get("releaseDate"),
+    )
+
+
+def _producto_merch(producto_data):
+    """Construye el Product de un artículo de merchandising a partir de su JSON de TyA."""
+    return Product(
+        merch_id=producto_data.get("merchId"),
+        name=producto_data.get("title"),
+        description=producto_data.get("description"),
+        price=producto_data.get("price"),
+        artist=producto_data.get("artistId", 0),
+        colaborators=producto_data.get("collaborators", []),
+        genre=None,  # Merch no tiene género en TyA
+        cover=producto_data.get("cover"),
+        release_date=producto_data.get("releaseDate"),
+    )
 
 
 def add_to_cart(body=None):
@@ -88,7 +174,7 @@ def add_to_cart(body=None):
             return Error(code="400", message="El cuerpo de la petición no es JSON").to_dict(), 400
         
         print(f"[DEBUG] add_to_cart: Parseando body desde JSON")
-        body = CartBody.from_dict(connexion.request.get_json())
+        body = CartBody.from_dict(body)
         print(f"[DEBUG] add_to_cart: Body parseado - song_id={body.song_id}, album_id={body.album_id}, merch_id={body.merch_id}")
 
         # Obtener user_id del contexto (ya validado por check_oversound_auth)
@@ -208,8 +294,9 @@ def get_cart_products():
         individual, continúa con los demás en lugar de fallar completamente.
         
     Performance:
-        Realiza múltiples peticiones HTTP síncronas. Para carritos grandes,
-        considerar implementación con peticiones asíncronas o batch.
+        Los productos obtenidos de TyA se guardan en caché PRODUCT_CACHE_TTL
+        segundos (300 por defecto): los repetidos no vuelven a pedirse ni a
+        construirse. Los fallos de caché realizan peticiones HTTP síncronas.
     """
     print("[DEBUG] get_cart_products: Inicio de la función")
     db_conexion = None
@@ -270,23 +357,16 @@ def get_cart_products():
         print(f"[DEBUG] get_cart_products: Resolviendo información de productos desde TyA ({TYA_SERVICE_URL})")
         for cancion_id in canciones:
             try:
+                producto_schema = _CACHE_PRODUCTOS.get(("song", cancion_id))
+                if producto_schema is not None:
+                    productos.append(producto_schema)
+                    continue
                 print(f"[DEBUG] get_cart_products: Obteniendo canción {cancion_id} desde TyA")
                 response = requests.get(f"{TYA_SERVICE_URL}/song/{cancion_id}", timeout=3)
                 print(f"[DEBUG] get_cart_products: Respuesta de TyA para canción {cancion_id}: status={response.status_code}")
                 if response.status_code == 200:
-                    producto_data = response.json()
-                    producto_schema = Product()
-                    producto_schema.song_id = producto_data.get("songId")
-                    producto_schema.name = producto_data.get("title")
-                    producto_schema.description = producto_data.get("description")
-                    producto_schema.price = producto_data.get("price")
-                    producto_schema.artist = producto_data.get("artistId", 0)
-                    producto_schema.colaborators = producto_data.get("collaborators", [])
-                    producto_schema.genre = producto_data.get("genres", [0])[0] if producto_data.get("genres") else 0
-                    producto_schema.duration = producto_data.get("duration", 0)
-                    producto_schema.cover = producto_data.get("cover")
-                    producto_schema.release_date = producto_data.get("releaseDate")
-                    producto_schema.album_id = producto_data.get("albumId")
+                    producto_schema = _producto_desde_tya(_producto_cancion, response.content)
+                    _CACHE_PRODUCTOS.set(("song", cancion_id), producto_schema)
                     productos.append(producto_schema)
                     print(f"[DEBUG] get_cart_products: Canción {cancion_id} añadida a productos")
             except Exception as e:
@@ -294,22 +374,16 @@ def get_cart_products():
 
         for album_id in albumes:
             try:
+                producto_schema = _CACHE_PRODUCTOS.get(("album", album_id))
+                if producto_schema is not None:
+                    productos.append(producto_schema)
+                    continue
                 print(f"[DEBUG] get_cart_products: Obteniendo álbum {album_id} desde TyA")
                 response = requests.get(f"{TYA_SERVICE_URL}/album/{album_id}", timeout=3)
                 print(f"[DEBUG] get_cart_products: Respuesta de TyA para álbum {album_id}: status={response.status_code}")
                 if response.status_code == 200:
-                    producto_data = response.json()
-                    producto_schema = Product()
-                    producto_schema.album_id = producto_data.get("albumId")
-                    producto_schema.name = producto_data.get("title")
-                    producto_schema.description = producto_data.get("description")
-                    producto_schema.price = producto_data.get("price")
-                    producto_schema.artist = producto_data.get("artistId", 0)
-                    producto_schema.colaborators = producto_data.get("collaborators", [])
-                    producto_schema.genre = producto_data.get("genres", [0])[0] if producto_data.get("genres") else 0
-                    producto_schema.song_list = producto_data.get("songs", [])
-                    producto_schema.cover = producto_data.get("cover")
-                    producto_schema.release_date = producto_data.get("releaseDate")
+                    producto_schema = _producto_desde_tya(_producto_album, response.content)
+                    _CACHE_PRODUCTOS.set(("album", album_id), producto_schema)
                     productos.append(producto_schema)
                     print(f"[DEBUG] get_cart_products: Álbum {album_id} añadido a productos")
             except Exception as e:
@@ -318,21 +392,16 @@ def get_cart_products():
         for merch_tuple in merchs:
             merch_id = merch_tuple[0]  # El primer elemento es el ID
             try:
+                producto_schema = _CACHE_PRODUCTOS.get(("merch", merch_id))
+                if producto_schema is not None:
+                    productos.append(producto_schema)
+                    continue
                 print(f"[DEBUG] get_cart_products: Obteniendo merch {merch_id} desde TyA")
                 response = requests.get(f"{TYA_SERVICE_URL}/merch/{merch_id}", timeout=3)
                 print(f"[DEBUG] get_cart_products: Respuesta de TyA para merch {merch_id}: status={response.status_code}")
                 if response.status_code == 200:
-                    producto_data = response.json()
-                    producto_schema = Product()
-                    producto_schema.merch_id = producto_data.get("merchId")
-                    producto_schema.name = producto_data.get("title")
-                    producto_schema.description = producto_data.get("description")
-                    producto_schema.price = producto_data.get("price")
-                    producto_schema.artist = producto_data.get("artistId", 0)
-                    producto_schema.colaborators = producto_data.get("collaborators", [])
-                    producto_schema.genre = None  # Merch no tiene género en TyA
-                    producto_schema.cover = producto_data.get("cover")
-                    producto_schema.release_date = producto_data.get("releaseDate")
+                    producto_schema = _producto_desde_tya(_producto_merch, response.content)
+                    _CACHE_PRODUCTOS.set(("merch", merch_id), producto_schema)
                     productos.append(producto_schema)
                     print(f"[DEBUG] get_cart_products: Merch {merch_id} añadido a productos")
             except Exception as e:
@@ -340,7 +409,9 @@ def get_cart_products():
 
         cursor.close()
         print(f"[DEBUG] get_cart_products: Total de productos a retornar: {len(productos)}")
-        return [p.to_dict() for p in productos], 200
+        # Serialización directa con orjson: evita el JSONEncoder de Flask en
+        # la lista de productos, la respuesta más pesada del carrito.
+        return Response(orjson.dumps([p.to_dict() for p in productos]), status=200, mimetype="application/json")
 
     except Exception as e:
         print(f"[DEBUG] get_cart_products: EXCEPCIÓN - {type(e).__name__}: {str(e)}")
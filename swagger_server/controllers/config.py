@@ -1,3 +1,12 @@
 import os
 
-TYA_SERVICE_URL = os.getenv('HOST_TYA', 'http://localhost:8081')  # ajusta al host de TyA
\ No newline at end of file
+TYA_SERVICE_URL = os.getenv('HOST_TYA', 'http://localhost:8081')  # ajusta al host de TyA
+
+# Caché del catálogo de /store (segundos). STORE_CACHE_TTL=0 desactiva la caché.
+STORE_CACHE_TTL = int(os.getenv('STORE_CACHE_TTL', 60))
+# Tiempo extra durante el que se sirve el catálogo caducado mientras se refresca en segundo plano
+STORE_CACHE_STALE = int(os.getenv('STORE_CACHE_STALE', 120))
+
+# Caché de productos de TyA usada por el carrito (segundos y número máximo de entradas)
+PRODUCT_CACHE_TTL = int(os.getenv('PRODUCT_CACHE_TTL', 300))
+PRODUCT_CACHE_SIZE = int(os.getenv('PRODUCT_CACHE_SIZE', 4096))
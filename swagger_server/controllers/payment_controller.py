@@ -28,14 +28,20 @@ Dependencias:
 """
 
 import connexion
+import orjson
 import six
 import requests
+from flask import Response
 
 from swagger_server.models.error import Error  # noqa: E501
 from swagger_server.models.payment_method import PaymentMethod  # noqa: E501
 from swagger_server import util
 from swagger_server.dbconx import dbConectar, dbDesconectar
 
+# Las respuestas de los endpoints de pago (también las de error) no deben
+# guardarse en cachés compartidas
+_SIN_CACHE = {"Cache-Control": "no-store"}
+
 
 def add_payment_method(body=None):
     """
@@ -69,7 +75,7 @@ def add_payment_method(body=None):
     Returns:
         Tuple[Dict|Error, int]: Tupla con respuesta y código HTTP:
             - ({"message": "...", "userId": id}, 200): Método creado exitosamente
-            - (Error, 400): Petición JSON inválida
+            - (Error, 400): Petición JSON inválida o datos fuera de rango
             - (Error, 401): Token no encontrado
             - (Error, 403): Usuario no autorizado
             - (Error, 500): Error de BD o creación fallida
@@ -98,8 +104,13 @@ def add_payment_method(body=None):
         print("[DEBUG] add_payment_method: Verificando si la petición es JSON")
         if not connexion.request.is_json:
             print("[DEBUG] add_payment_method: ERROR - La petición no es JSON")
-            return Error(code="400", message="El cuerpo de la petición no es JSON").to_dict(), 400
-        body = PaymentMethod.from_dict(connexion.request.get_json())
+            return Error(code="400", message="El cuerpo de la petición no es JSON").to_dict(), 400, _SIN_CACHE
+        try:
+            body = PaymentMethod.from_dict(body)
+            body.validar_entrada()
+        except ValueError as e:
+            print(f"[DEBUG] add_payment_method: ERROR - Body inválido: {e}")
+            return Error(code="400", message=str(e)).to_dict(), 400, _SIN_CACHE
         print(f"[DEBUG] add_payment_method: Body parseado correctamente")
 
         # Obtener user_id del contexto (ya validado por check_oversound_auth)
@@ -114,7 +125,7 @@ def add_payment_method(body=None):
         db_conexion = dbConectar()
         if db_conexion is None:
             print("[DEBUG] add_payment_method: ERROR - No se pudo conectar a la base de datos")
-            return Error(code="503", message="Error al conectar con la base de datos").to_dict(), 503
+            return Error(code="503", message="Error al conectar con la base de datos").to_dict(), 503, _SIN_CACHE
         cursor = db_conexion.cursor()
         print("[DEBUG] add_payment_method: Conexión establecida")
 
@@ -135,7 +146,7 @@ def add_payment_method(body=None):
         if not result:
             print("[DEBUG] add_payment_method: ERROR - No se obtuvo ID del método de pago")
             db_conexion.rollback()
-            return Error(code="500", message="No se pudo crear el método de pago").to_dict(), 500
+            return Error(code="500", message="No se pudo crear el método de pago").to_dict(), 500, _SIN_CACHE
         id_metodo = result[0]
         print(f"[DEBUG] add_payment_method: Método de pago creado con ID = {id_metodo}")
 
@@ -154,7 +165,7 @@ def add_payment_method(body=None):
         cursor.close()
         print("[DEBUG] add_payment_method: Método de pago añadido exitosamente")
 
-        return {"message": f"Método de pago agregado con id {id_metodo}", "userId": user_id}, 200
+        return {"message": f"Método de pago agregado con id {id_metodo}", "userId": user_id}, 200, _SIN_CACHE
 
     except Exception as e:
         if db_conexion:
@@ -162,7 +173,7 @@ def add_payment_method(body=None):
         print(f"[DEBUG] add_payment_method: EXCEPCIÓN - {type(e).__name__}: {str(e)}")
         import traceback
         traceback.print_exc()
-        return Error(code="500", message=str(e)).to_dict(), 500
+        return Error(code="500", message=str(e)).to_dict(), 500, _SIN_CACHE
 
     finally:
         if db_conexion:
@@ -216,7 +227,7 @@ def delete_payment_method(payment_method_id):
         db_conexion = dbConectar()
         if db_conexion is None:
             print("[DEBUG] delete_payment_method: ERROR - No se pudo conectar a la base de datos")
-            return Error(code="503", message="Error al conectar con la base de datos").to_dict(), 503
+            return Error(code="503", message="Error al conectar con la base de datos").to_dict(), 503, _SIN_CACHE
         cursor = db_conexion.cursor()
         print("[DEBUG] delete_payment_method: Conexión establecida")
 
@@ -228,7 +239,7 @@ def delete_payment_method(payment_method_id):
         )
         if not cursor.fetchone():
             print(f"[DEBUG] delete_payment_method: ERROR - Método de pago no encontrado o no pertenece al usuario")
-            return Error(code="404", message="Método de pago no encontrado o no pertenece al usuario").to_dict(), 404
+            return Error(code="404", message="Método de pago no encontrado o no pertenece al usuario").to_dict(), 404, _SIN_CACHE
 
         # Eliminar la asociación usuario-método
         print(f"[DEBUG] delete_payment_method: Eliminando asociación usuario-método")
@@ -243,7 +254,7 @@ def delete_payment_method(payment_method_id):
         db_conexion.commit()
         cursor.close()
         print("[DEBUG] delete_payment_method: Método de pago eliminado exitosamente")
-        return {"message": "Método de pago eliminado correctamente"}, 200
+        return {"message": "Método de pago eliminado correctamente"}, 200, _SIN_CACHE
 
     except Exception as e:
         if db_conexion:
@@ -251,7 +262,7 @@ def delete_payment_method(payment_method_id):
         print(f"[DEBUG] delete_payment_method: EXCEPCIÓN - {type(e).__name__}: {str(e)}")
         import traceback
         traceback.print_exc()
-        return Error(code="500", message=str(e)).to_dict(), 500
+        return Error(code="500", message=str(e)).to_dict(), 500, _SIN_CACHE
 
     finally:
         if db_conexion:
@@ -325,7 +336,7 @@ def show_user_payment_methods():
         db_conexion = dbConectar()
         if db_conexion is None:
             print("[DEBUG] get_payment_methods: ERROR - No se pudo conectar a la base de datos")
-            return Error(code="503", message="Error al conectar con la base de datos").to_dict(), 503
+            return Error(code="503", message="Error al conectar con la base de datos").to_dict(), 503, _SIN_CACHE
         cursor = db_conexion.cursor()
 
         ids_metodos_pago = []
@@ -336,7 +347,7 @@ def show_user_payment_methods():
         rows_ids = cursor.fetchall()
         ids_metodos_pago = [row[0] for row in rows_ids]
         if not ids_metodos_pago:
-            return [], 200  # Retornar lista vacía si no hay métodos de pago
+            return [], 200, _SIN_CACHE  # Retornar lista vacía si no hay métodos de pago
 
         for metodo_id in ids_metodos_pago:
             cursor.execute("""
@@ -357,13 +368,14 @@ def show_user_payment_methods():
                 # No need to add id as attribute since it's now a property
                 metodos.append(metodo)
         cursor.close()
-        return [m.to_dict() for m in metodos], 200
+        return Response(orjson.dumps([m.to_dict() for m in metodos]), status=200,
+                        mimetype="application/json", headers=_SIN_CACHE)
 
     except Exception as e:
         print(f"[DEBUG] get_payment_methods: EXCEPCIÓN - {type(e).__name__}: {str(e)}")
         import traceback
         traceback.print_exc()
-        return Error(code="500", message=str(e)).to_dict(), 500
+        return Error(code="500", message=str(e)).to_dict(), 500, _SIN_CACHE
 
     finally:
         if db_conexion:
@@ -138,7 +138,11 @@ def set_purchase(body=None):
         if not connexion.request.is_json:
             print("[DEBUG] create_purchase: ERROR - La petición no es JSON")
             return Error(code="400", message="El cuerpo de la petición no es JSON").to_dict(), 400
-        body = Purchase.from_dict(connexion.request.get_json())
+        try:
+            body = Purchase.from_dict(body)
+        except ValueError as e:
+            print(f"[DEBUG] create_purchase: ERROR - Body inválido: {e}")
+            return Error(code="400", message=str(e)).to_dict(), 400
         print(f"[DEBUG] create_purchase: Body parseado correctamente")
         print(f"[DEBUG] create_purchase: Body recibido: {body.to_dict() if hasattr(body, 'to_dict') else body.__dict__}")
 
@@ -20,7 +20,7 @@ Arquitectura:
     Beneficios del patrón:
         - Desacoplamiento entre frontend y TyA
         - Transformación de datos centralizada
-        - Caché potencial (no implementado)
+        - Caché del catálogo en memoria con stale-while-revalidate
         - Agregación de múltiples fuentes de datos
 
 Dependencias:
@@ -33,26 +33,324 @@ Dependencias:
             - GET /album/list?ids=...: Obtiene detalles completos de álbumes por IDs
             - GET /merch/list?ids=...: Obtiene detalles completos de merch por IDs
 
+Portadas:
+    Las portadas en base64 no viajan en /store: se sustituyen por una URL
+    /store/covers/<hash> (ver swagger_server.covers) que sirve
+    get_store_cover con caché de navegador de larga duración. Los bytes de
+    las portadas se guardan en la misma entrada de caché que el catálogo
+    que las referencia; si el catálogo no se cachea (consulta incompleta o
+    caché desactivada) las portadas se envían incrustadas, para no
+    publicar URLs que no se podrían servir.
+
 Modelo de datos:
-    Transforma datos de TyA al modelo Product de TPP, que incluye:
+    Transforma datos de TyA al esquema Product de TPP (como dicts con las
+    claves JSON del modelo, sin instanciarlo ni pasar por to_dict), que incluye:
         - Información básica: nombre, precio, descripción
         - Metadatos: artista, colaboradores, género, fecha de lanzamiento
-        - Contenido multimedia: portada (cover en base64)
+        - Contenido multimedia: portada (cover como URL de /store/covers)
         - Información específica por tipo (duración para canciones, lista de canciones para álbumes)
 
 Performance:
-    - Realiza 3 peticiones HTTP síncronas al microservicio TyA
-    - Considera implementar caché para reducir latencia y carga en TyA
+    - Las peticiones independientes a TyA se lanzan en paralelo (pool de hilos)
+    - El catálogo se guarda en caché STORE_CACHE_TTL segundos (60 por defecto);
+      con la caché fresca /store no consulta TyA
     - Timeout configurado a 5 segundos por petición
+    - Los /list con muchos IDs se dividen en lotes de 200 pedidos en paralelo
+    - Sesión HTTP persistente con pool de conexiones keep-alive hacia TyA
     - Implementa paginación para optimizar transferencia de datos
+    - ETag por versión del catálogo y página: los clientes que refrescan
+      sin cambios reciben 304 Not Modified sin cuerpo
 """
 
+import atexit
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import requests
+from flask import Response, request
+from requests.adapters import HTTPAdapter
+from swagger_server.cache import TTLCache
+from swagger_server.covers import extraer_portadas, portada_en_linea
 from swagger_server.models.error import Error
-from swagger_server.models.product import Product
-from swagger_server.controllers.config import TYA_SERVICE_URL
+from swagger_server.controllers.config import TYA_SERVICE_URL, STORE_CACHE_TTL, STORE_CACHE_STALE
+from swagger_server.controllers.store_mapping import mapear_cancion, mapear_album, mapear_merch
+
+logger = logging.getLogger(__name__)
+
+# Pool compartido para lanzar en paralelo las peticiones independientes a TyA.
+# Connexion sirve los controladores de forma síncrona (WSGI), así que los
+# hilos son la forma de solapar las esperas de red dentro de una petición.
+_EJECUTOR_TYA = ThreadPoolExecutor(max_workers=16, thread_name_prefix="tya")
+
+# Máximo de IDs por petición /list a TyA y pool para pedir los lotes en paralelo.
+_TAMANO_LOTE_TYA = 200
+_EJECUTOR_LOTES_TYA = ThreadPoolExecutor(max_workers=16, thread_name_prefix="tya-lotes")
+
+# Sesión HTTP persistente hacia TyA: reutiliza las conexiones keep-alive entre
+# peticiones (y entre los hilos del pool) en lugar de abrir y cerrar una
+# conexión TCP por cada llamada.
+_SESION_TYA = requests.Session()
+_SESION_TYA.headers.update({"Accept": "application/json"})
+_SESION_TYA.mount("http://", HTTPAdapter(pool_maxsize=32))
+_SESION_TYA.mount("https://", HTTPAdapter(pool_maxsize=32))
+atexit.register(_SESION_TYA.close)
+
+# Caché del catálogo completo (antes de paginar). Cada entrada guarda el
+# instante en que se consultó TyA para decidir si está fresca o caducada;
+# se conserva STORE_CACHE_STALE segundos más para servirla mientras se refresca.
+_CLAVE_CATALOGO = "store:catalog:v1"
+_CACHE_CATALOGO = TTLCache(maxsize=1, ttl=STORE_CACHE_TTL + STORE_CACHE_STALE)
+_REVALIDANDO = threading.Lock()
+# Serializa la carga síncrona sin caché: solo una petición consulta TyA y
+# las demás esperan y reutilizan su resultado.
+_CARGANDO = threading.Lock()
+
+
+def _get_tya(url, **kwargs):
+    """Realiza un GET al microservicio TyA usando la sesión persistente."""
+    return _SESION_TYA.get(url, timeout=5.0, **kwargs)
+
+def _extraer_ids(data, clave_id):
+    """
+    Extrae los IDs de la respuesta de un endpoint /filter de TyA.
+
+    La respuesta puede venir como lista de enteros [1, 2, 3] o como lista de
+    objetos [{"songId": 1}, ...].
+    """
+    if not data:
+        return []
+    if isinstance(data[0], int):
+        return data
+    if isinstance(data[0], dict):
+        return [id_ for item in data if (id_ := item.get(clave_id))]
+    return []
+
+
+def _obtener_lote_tya(tipo, ids):
+    """Obtiene de GET /{tipo}/list los objetos de un lote de IDs (None si TyA responde con error)."""
+    ids_str = ",".join(map(str, ids))  # Convertir lista a "1,2,3,..."
+    response = _get_tya(f"{TYA_SERVICE_URL}/{tipo}/list?ids={ids_str}")
+    return orjson.loads(response.content) if response.ok else None
+
+
+def _obtener_catalogo_tya(tipo, clave_id):
+    """
+    Obtiene los objetos completos de un tipo de recurso de TyA.
+
+    Encadena GET /{tipo}/filter (sin parámetros devuelve todos los IDs) y
+    GET /{tipo}/list?ids=... dentro de la misma tarea. Si hay más de
+    _TAMANO_LOTE_TYA IDs, /list se pide en lotes paralelos para acotar la
+    longitud de la URL y repartir el trabajo entre los workers de TyA.
+
+    Args:
+        tipo (str): Recurso de TyA ("song", "album", "merch" o "artist").
+        clave_id (str): Nombre del campo ID en la respuesta de /filter.
+
+    Returns:
+        list: Objetos completos devueltos por TyA (lista vacía si no hay
+            IDs), o None si /filter o algún /list responde con error, para
+            que el catálogo resultante no se guarde en caché.
+    """
+    response = _get_tya(f"{TYA_SERVICE_URL}/{tipo}/filter")
+    if not response.ok:
+        return None
+    ids = _extraer_ids(orjson.loads(response.content), clave_id)
+    if not ids:
+        return []
+    if len(ids) <= _TAMANO_LOTE_TYA:
+        return _obtener_lote_tya(tipo, ids)
+
+    # Los lotes van a su propio pool: esta función ya se ejecuta en
+    # _EJECUTOR_TYA y esperar ahí a tareas del mismo pool podría agotarlo.
+    futuros = [
+        _EJECUTOR_LOTES_TYA.submit(_obtener_lote_tya, tipo, ids[i:i + _TAMANO_LOTE_TYA])
+        for i in range(0, len(ids), _TAMANO_LOTE_TYA)
+    ]
+    objetos = []
+    for futuro in futuros:
+        lote = futuro.result()
+        if lote is None:
+            return None  # Igual que sin lotes: un /list fallido invalida el tipo
+        objetos.extend(lote)
+    return objetos
+
+
+def _resultado_tya(futuro, descripcion):
+    """
+    Espera una cadena de _obtener_catalogo_tya y aísla sus errores.
+
+    Si TyA responde con error o falla la comunicación se retorna None para
+    ese tipo (el llamador lo trata como lista vacía), de modo que el resto
+    del catálogo se sirve igualmente pero no se guarda en caché un
+    resultado parcial.
+    """
+    try:
+        return futuro.result()
+    except requests.RequestException as e:
+        logger.warning("Error al conectar con Temas y Autores (%s): %s", descripcion, e)
+    except Exception:
+        logger.exception("Error inesperado al obtener %s de TyA", descripcion)
+    return None
+
+
+def _consultar_catalogo():
+    """
+    Consulta TyA y construye el catálogo completo de la tienda (sin paginar).
+
+    Returns:
+        Tuple[dict, bool]: Catálogo con las claves "productos" (portadas
+            tal y como las envía TyA), "genres" y "artists", y un indicador
+            de si todas las consultas a TyA terminaron sin errores (solo
+            entonces se guarda en caché).
+    """
+    productos = []
+
+    # --- Obtener datos del microservicio Temas y Autores ---
+    # Cada tipo de producto es una cadena filter → list independiente.
+    # Las cadenas se lanzan a la vez y cada una pasa a su /list en cuanto
+    # tiene sus IDs, sin esperar a las demás. Géneros y artistas no
+    # dependen de los productos y viajan en paralelo con el resto.
+    futuro_canciones = _EJECUTOR_TYA.submit(_obtener_catalogo_tya, "song", "songId")
+    futuro_albumes = _EJECUTOR_TYA.submit(_obtener_catalogo_tya, "album", "albumId")
+    futuro_merch = _EJECUTOR_TYA.submit(_obtener_catalogo_tya, "merch", "merchId")
+    futuro_artistas = _EJECUTOR_TYA.submit(_obtener_catalogo_tya, "artist", "artistId")
+    futuro_generos = _EJECUTOR_TYA.submit(_get_tya, f"{TYA_SERVICE_URL}/genres")
+
+    canciones = _resultado_tya(futuro_canciones, "canciones")
+    albumes = _resultado_tya(futuro_albumes, "álbumes")
+    merch = _resultado_tya(futuro_merch, "merchandising")
+    all_artists = _resultado_tya(futuro_artistas, "artistas")
+    completo = all(r is not None for r in (canciones, albumes, merch, all_artists))
+    canciones, albumes, merch = canciones or [], albumes or [], merch or []
+    all_artists = all_artists or []
+
+    # --- Mapear cada tipo de producto al esquema Product ---
+    productos.extend(map(mapear_cancion, canciones))
+    productos.extend(map(mapear_album, albumes))
+    productos.extend(map(mapear_merch, merch))
+
+    # --- Obtener catálogos de géneros y artistas (para filtros del frontend) ---
+    all_genres = []
+    
+    try:
+        # Obtener lista completa de géneros
+        genres_response = futuro_generos.result()
+        if genres_response.ok:
+            all_genres = orjson.loads(genres_response.content)
+        else:
+            completo = False
+    except requests.RequestException as e:
+        logger.warning("Error obteniendo géneros: %s", e)
+        completo = False
+
+    catalogo = {
+        "productos": productos,
+        "genres": all_genres,
+        "artists": all_artists
+    }
+    return catalogo, completo
+
 
-def show_storefront_products(page=1, limit=20):
+def _refrescar_catalogo():
+    """
+    Consulta TyA y guarda el catálogo en caché si la consulta fue completa.
+
+    Solo un catálogo que se va a cachear publica sus portadas como URL de
+    /store/covers: sus bytes quedan en "portadas" dentro de la misma entrada
+    de caché, de modo que viven exactamente lo mismo que el catálogo que
+    las referencia. En otro caso las portadas se quedan incrustadas.
+    """
+    catalogo, completo = _consultar_catalogo()
+    cachear = completo and STORE_CACHE_TTL > 0
+    catalogo["portadas"] = extraer_portadas(catalogo["productos"]) if cachear else {}
+    # Huella del contenido: se calcula una vez por consulta a TyA (y se
+    # cachea con el catálogo) para los ETag de /store. Las URLs de portada
+    # ya derivan del contenido de la imagen.
+    catalogo["version"] = hashlib.blake2b(
+        orjson.dumps([catalogo["productos"], catalogo["genres"], catalogo["artists"]]),
+        digest_size=16).hexdigest()
+    if cachear:
+        _CACHE_CATALOGO.set(_CLAVE_CATALOGO, (time.monotonic(), catalogo))
+    return catalogo
+
+
+def _revalidar_catalogo():
+    """Refresca el catálogo en segundo plano (una sola revalidación a la vez)."""
+    if not _REVALIDANDO.acquire(blocking=False):
+        return
+
+    def _tarea():
+        try:
+            _refrescar_catalogo()
+        except Exception:
+            logger.exception("Error al revalidar el catálogo de la tienda")
+        finally:
+            _REVALIDANDO.release()
+
+    threading.Thread(target=_tarea, name="store-revalidate", daemon=True).start()
+
+
+def _obtener_catalogo():
+    """
+    Retorna el catálogo de la tienda usando la caché con stale-while-revalidate.
+
+    - Entrada fresca (< STORE_CACHE_TTL): se sirve directamente sin consultar TyA.
+    - Entrada caducada pero dentro de STORE_CACHE_STALE: se sirve la copia
+      antigua y se lanza una revalidación en segundo plano.
+    - Sin entrada: se consulta TyA de forma síncrona, una sola petición a
+      la vez; las que llegan mientras tanto esperan y usan ese resultado.
+    """
+    entrada = _CACHE_CATALOGO.get(_CLAVE_CATALOGO)
+    if entrada is not None:
+        momento, catalogo = entrada
+        if time.monotonic() - momento >= STORE_CACHE_TTL:
+            _revalidar_catalogo()
+        return catalogo
+    if STORE_CACHE_TTL <= 0:
+        return _refrescar_catalogo()  # Sin caché no hay resultado que compartir
+    with _CARGANDO:
+        # Otra petición puede haberlo cargado mientras se esperaba el lock
+        entrada = _CACHE_CATALOGO.get(_CLAVE_CATALOGO)
+        if entrada is not None:
+            return entrada[1]
+        return _refrescar_catalogo()
+
+
+def invalidar_catalogo():
+    """Descarta el catálogo en caché; la siguiente petición consultará TyA."""
+    _CACHE_CATALOGO.pop(_CLAVE_CATALOGO)
+
+
+def _serializar_pagina(productos, paginacion, generos, artistas):
+    """
+    Serializa con orjson el JSON de respuesta de /store.
+
+    Se serializa entero antes de construir la Response (y no por trozos
+    desde un generador) para que un fallo al serializar ocurra dentro del
+    manejador y se responda con un Error 500 en lugar de un 200 truncado.
+
+    Returns:
+        bytes: Documento {"data": [...], "pagination": {...}, "genres": [...],
+            "artists": [...]}.
+    """
+    return orjson.dumps({
+        "data": productos,
+        "pagination": paginacion,
+        "genres": generos,
+        "artists": artistas
+    })
+
+
+def _cache_control_store():
+    """Cabecera Cache-Control de /store, alineada con la caché del catálogo."""
+    return f"max-age={min(30, STORE_CACHE_TTL)}, stale-while-revalidate={STORE_CACHE_STALE}"
+
+
+def show_storefront_products(page=1, limit=20, include=None):
     """
     Obtiene y retorna el catálogo paginado de productos de la tienda.
     
@@ -63,20 +361,23 @@ def show_storefront_products(page=1, limit=20):
     Args:
         page (int, optional): Número de página a retornar (comienza en 1). Default: 1.
         limit (int, optional): Cantidad de productos por página (1-100). Default: 20.
+        include (str, optional): Campos adicionales separados por comas. Con
+            "cover" las portadas se incrustan en base64 en lugar de enviarse
+            como URL de /store/covers. Default: None.
     
     Flujo de operación:
-        1. Realiza 3 peticiones HTTP al microservicio TyA usando endpoints filter:
-           - GET /song/filter: Obtiene IDs de todas las canciones
-           - GET /album/filter: Obtiene IDs de todos los álbumes
-           - GET /merch/filter: Obtiene IDs de todo el merchandising
-        2. Para cada tipo, obtiene detalles completos usando endpoints list:
-           - GET /song/list?ids=...: Detalles de canciones
-           - GET /album/list?ids=...: Detalles de álbumes
-           - GET /merch/list?ids=...: Detalles de merchandising
-        3. Mapea cada tipo de producto al modelo Product
+        1. Lanza en paralelo una cadena filter → list por cada tipo de producto:
+           - GET /song/filter → GET /song/list?ids=...: Canciones
+           - GET /album/filter → GET /album/list?ids=...: Álbumes
+           - GET /merch/filter → GET /merch/list?ids=...: Merchandising
+        2. Cada cadena pide sus detalles en cuanto tiene sus IDs, sin esperar
+           a las demás (no hay barrera entre la capa filter y la capa list)
+        3. Mapea cada tipo de producto a un dict con las claves JSON del esquema
+           Product (Product.attribute_map), sin instanciar el modelo
         4. Combina todos los productos en una lista única
         5. Aplica paginación sobre los resultados
-        6. Serializa y retorna la lista paginada con metadata
+        6. Si el ETag de la página coincide con If-None-Match, retorna 304
+        7. Serializa y retorna la lista paginada con metadata, ETag y Cache-Control
     
     Mapeo de datos:
         Canciones:
@@ -101,12 +402,14 @@ def show_storefront_products(page=1, limit=20):
     
     Manejo de errores:
         - Si falla la conexión con TyA, retorna listas vacías para ese tipo
-        - Errores de conexión se registran en consola
+        - Errores de conexión se registran con logging (nivel WARNING)
         - La función continúa con los tipos disponibles
         - Errores generales retornan objeto Error con código 500
     
     Returns:
-        Dict|Error: Objeto con datos paginados y metadata, o Error en caso de fallo crítico.
+        Response|Error: Respuesta JSON (serializada con orjson) con datos
+            paginados y metadata, 304 Not Modified si el
+            cliente ya tiene esa versión, o Error en caso de fallo crítico.
             Éxito: {
                 "data": [Product, ...],  # Lista de productos de la página actual
                 "pagination": {
@@ -134,7 +437,7 @@ def show_storefront_products(page=1, limit=20):
                         "price": 1.99,
                         "duration": 354,
                         "genre": "3",
-                        "cover": "data:image/png;base64,...",
+                        "cover": "/store/covers/3f2a9c1d0e8b7a65",
                         ...
                     },
                     {
@@ -159,14 +462,17 @@ def show_storefront_products(page=1, limit=20):
         - Lista vacía si no hay productos en el rango solicitado
     
     Performance considerations:
-        - 6 peticiones HTTP síncronas (3 para IDs + 3 para detalles)
+        - 6 peticiones HTTP en tres cadenas paralelas (filter → list por tipo),
+          por lo que la latencia es ~2×RTT en lugar de ~6×RTT y un tipo lento
+          no retrasa el /list de los demás
+        - Géneros y artistas se solicitan en paralelo con el catálogo
         - Timeout de 5 segundos por petición
-        - No implementa caché (cada request consulta TyA)
+        - Caché del catálogo completo: con la caché fresca no se consulta TyA;
+          caducada se sirve la copia anterior y se refresca en segundo plano
+        - Los resultados parciales (algún fallo de TyA) no se guardan en caché
         - Paginación se aplica en memoria después de obtener todos los productos
         - Implementación actual más eficiente que consultas individuales
         - Considera implementar:
-            * Peticiones asíncronas con asyncio
-            * Caché con TTL configurable
             * Paginación a nivel de TyA para reducir transferencia
             * Batch único si TyA implementa endpoint combinado
     
@@ -182,224 +488,8 @@ def show_storefront_products(page=1, limit=20):
         - Los géneros se manejan como el primer elemento de la lista de TyA
     """
     try:
-        productos = []
-
-        # --- Obtener datos del microservicio Temas y Autores ---
-        try:
-            # PASO 1: Obtener IDs usando endpoints /filter (sin parámetros = todos)
-            # -----------------------------------------------------------------------
-            # Los endpoints /song/filter, /album/filter y /merch/filter retornan
-            # listas de objetos con solo los IDs cuando se llaman sin parámetros.
-            # Esto es más eficiente que obtener objetos completos inicialmente.
-            # Formato de respuesta: [{"songId": 1}, {"songId": 2}, ...]
-            
-            song_ids_response = requests.get(
-                f"{TYA_SERVICE_URL}/song/filter",
-                timeout=5.0,
-                headers={"Accept": "application/json"}
-            )
-            album_ids_response = requests.get(
-                f"{TYA_SERVICE_URL}/album/filter",
-                timeout=5.0,
-                headers={"Accept": "application/json"}
-            )
-            merch_ids_response = requests.get(
-                f"{TYA_SERVICE_URL}/merch/filter",
-                timeout=5.0,
-                headers={"Accept": "application/json"}
-            )
-            
-            # Extraer IDs - puede venir como lista de enteros [1, 2, 3] o lista de objetos [{"songId": 1}]
-            song_ids = []
-            album_ids = []
-            merch_ids = []
-            
-            if song_ids_response.ok:
-                data = song_ids_response.json()
-                if data and len(data) > 0:
-                    # Verificar si es lista de enteros o lista de objetos
-                    if isinstance(data[0], int):
-                        song_ids = data
-                    elif isinstance(data[0], dict):
-                        song_ids = [item.get("songId") for item in data if item.get("songId")]
-            
-            if album_ids_response.ok:
-                data = album_ids_response.json()
-                if data and len(data) > 0:
-                    if isinstance(data[0], int):
-                        album_ids = data
-                    elif isinstance(data[0], dict):
-                        album_ids = [item.get("albumId") for item in data if item.get("albumId")]
-            
-            if merch_ids_response.ok:
-                data = merch_ids_response.json()
-                if data and len(data) > 0:
-                    if isinstance(data[0], int):
-                        merch_ids = data
-                    elif isinstance(data[0], dict):
-                        merch_ids = [item.get("merchId") for item in data if item.get("merchId")]
-            
-            # PASO 2: Obtener detalles completos usando endpoints /list
-            # ----------------------------------------------------------
-            # Los endpoints /song/list, /album/list y /merch/list aceptan múltiples
-            # IDs en formato comma-separated (ej: "1,2,3,5,8") y retornan los objetos
-            # completos con toda la información (title, price, cover, etc.).
-            # Esto permite hacer batch requests en lugar de N peticiones individuales.
-            canciones = []
-            albumes = []
-            merch = []
-            
-            # Solo hacer petición si existen IDs (optimización)
-            if song_ids:
-                ids_str = ",".join(map(str, song_ids))  # Convertir lista a "1,2,3,..."
-                response = requests.get(
-                    f"{TYA_SERVICE_URL}/song/list?ids={ids_str}",
-                    timeout=5.0,
-                    headers={"Accept": "application/json"}
-                )
-                if response.ok:
-                    canciones = response.json()
-            
-            if album_ids:
-                ids_str = ",".join(map(str, album_ids))
-                response = requests.get(
-                    f"{TYA_SERVICE_URL}/album/list?ids={ids_str}",
-                    timeout=5.0,
-                    headers={"Accept": "application/json"}
-                )
-                if response.ok:
-                    albumes = response.json()
-            
-            if merch_ids:
-                ids_str = ",".join(map(str, merch_ids))
-                response = requests.get(
-                    f"{TYA_SERVICE_URL}/merch/list?ids={ids_str}",
-                    timeout=5.0,
-                    headers={"Accept": "application/json"}
-                )
-                if response.ok:
-                    merch = response.json()
-                    
-        except requests.RequestException as e:
-            print(f"Error al conectar con Temas y Autores: {e}")
-            canciones, albumes, merch = [], [], []
-        except Exception as e:
-            print(f"Error inesperado al obtener datos de TyA: {e}")
-            canciones, albumes, merch = [], [], []
-
-        # --- Mapear / Enmascarar canciones ---
-        for c in canciones:
-            # Convertir strings a tipos correctos
-            artist_id = c.get("artistId")
-            if isinstance(artist_id, str):
-                artist_id = int(artist_id) if artist_id else 0
-            
-            duration = c.get("duration")
-            if isinstance(duration, str):
-                duration = int(duration) if duration else 0
-            
-            genres = c.get("genres", [])
-            if genres and isinstance(genres[0], str):
-                genres = [int(g) for g in genres if g]
-            genre = genres[0] if genres else 0
-            
-            collaborators = c.get("collaborators", [])
-            if collaborators and isinstance(collaborators[0], str):
-                collaborators = [int(col) for col in collaborators if col]
-            
-            price_str = c.get("price", "0")
-            if isinstance(price_str, str):
-                price_str = price_str.replace(",", ".")
-            price = float(price_str) if price_str else 0.0
-            
-            productos.append({
-                'songId': c.get("songId"),
-                'albumId': c.get("albumId"),
-                'merchId': None,
-                'name': c.get("title"),
-                'price': price,
-                'description': c.get("description"),
-                'artist': artist_id,
-                'colaborators': collaborators,
-                'releaseDate': f"{c.get('releaseDate')}T00:00:00Z" if c.get('releaseDate') else None,
-                'duration': duration,
-                'genre': genre,
-                'cover': c.get("cover"),
-                'songList': None
-            })
-
-        # --- Mapear álbumes ---
-        for a in albumes:
-            # Convertir strings a tipos correctos
-            artist_id = a.get("artistId")
-            if isinstance(artist_id, str):
-                artist_id = int(artist_id) if artist_id else 0
-            
-            genres = a.get("genres", [])
-            if genres and isinstance(genres[0], str):
-                genres = [int(g) for g in genres if g]
-            genre = genres[0] if genres else 0
-            
-            collaborators = a.get("collaborators", [])
-            if collaborators and isinstance(collaborators[0], str):
-                collaborators = [int(col) for col in collaborators if col]
-            
-            songs = a.get("songs", [])
-            if songs and isinstance(songs[0], str):
-                songs = [int(s) for s in songs if s]
-            
-            price_str = a.get("price", "0")
-            if isinstance(price_str, str):
-                price_str = price_str.replace(",", ".")
-            price = float(price_str) if price_str else 0.0
-            
-            productos.append({
-                'songId': None,
-                'albumId': a.get("albumId"),
-                'merchId': None,
-                'name': a.get("title"),
-                'price': price,
-                'description': a.get("description"),
-                'artist': artist_id,
-                'colaborators': collaborators,
-                'releaseDate': f"{a.get('releaseDate')}T00:00:00Z" if a.get('releaseDate') else None,
-                'duration': None,
-                'genre': genre,
-                'cover': a.get("cover"),
-                'songList': songs
-            })
-
-        # --- Mapear merch ---
-        for m in merch:
-            # Convertir strings a tipos correctos
-            artist_id = m.get("artistId")
-            if isinstance(artist_id, str):
-                artist_id = int(artist_id) if artist_id else 0
-            
-            collaborators = m.get("collaborators", [])
-            if collaborators and isinstance(collaborators[0], str):
-                collaborators = [int(col) for col in collaborators if col]
-            
-            price_str = m.get("price", "0")
-            if isinstance(price_str, str):
-                price_str = price_str.replace(",", ".")
-            price = float(price_str) if price_str else 0.0
-            
-            productos.append({
-                'songId': None,
-                'albumId': None,
-                'merchId': m.get("merchId"),
-                'name': m.get("title"),
-                'price': price,
-                'description': m.get("description"),
-                'artist': artist_id,
-                'colaborators': collaborators,
-                'releaseDate': f"{m.get('releaseDate')}T00:00:00Z" if m.get('releaseDate') else None,
-                'duration': None,
-                'genre': None,  # Merch no tiene género en TyA
-                'cover': m.get("cover"),
-                'songList': None
-            })
+        catalogo = _obtener_catalogo()
+        productos = catalogo["productos"]
 
         # --- Aplicar paginación ---
         # Validar y ajustar parámetros de paginación
@@ -422,71 +512,72 @@ def show_storefront_products(page=1, limit=20):
         start_index = (page - 1) * limit
         end_index = start_index + limit
         
+        # --- GET condicional ---
+        # El ETag identifica la versión del catálogo y la página pedida. Si el
+        # cliente ya la tiene (If-None-Match) se responde 304 sin cuerpo y sin
+        # serializar nada.
+        incluir_portadas = bool(include) and "cover" in include.split(",")
+        etag = f"{catalogo['version']}-{page}-{limit}" + ("-cover" if incluir_portadas else "")
+        cabeceras = {"Cache-Control": _cache_control_store()}
+        if request.if_none_match.contains_weak(etag):
+            respuesta = Response(status=304, headers=cabeceras)
+            respuesta.set_etag(etag, weak=True)
+            return respuesta
+
         # Aplicar paginación sobre la lista completa
         productos_paginados = productos[start_index:end_index]
-        
-        # --- Obtener catálogos de géneros y artistas (para filtros del frontend) ---
-        all_genres = []
-        all_artists = []
-        
-        try:
-            # Obtener lista completa de géneros
-            genres_response = requests.get(
-                f"{TYA_SERVICE_URL}/genres",
-                timeout=5.0,
-                headers={"Accept": "application/json"}
-            )
-            if genres_response.ok:
-                all_genres = genres_response.json()
-        except requests.RequestException as e:
-            print(f"Error obteniendo géneros: {e}")
-        
-        try:
-            # Obtener IDs de artistas
-            artist_ids_response = requests.get(
-                f"{TYA_SERVICE_URL}/artist/filter",
-                timeout=5.0,
-                headers={"Accept": "application/json"}
-            )
-            if artist_ids_response.ok:
-                data = artist_ids_response.json()
-                artist_ids = []
-                if data and len(data) > 0:
-                    # Verificar si es lista de enteros o lista de objetos
-                    if isinstance(data[0], int):
-                        artist_ids = data
-                    elif isinstance(data[0], dict):
-                        artist_ids = [item.get("artistId") for item in data if item.get("artistId")]
-                
-                # Obtener detalles completos de artistas
-                if artist_ids:
-                    ids_str = ",".join(map(str, artist_ids))
-                    artists_response = requests.get(
-                        f"{TYA_SERVICE_URL}/artist/list",
-                        params={"ids": ids_str},
-                        timeout=5.0,
-                        headers={"Accept": "application/json"}
-                    )
-                    if artists_response.ok:
-                        all_artists = artists_response.json()
-        except requests.RequestException as e:
-            print(f"Error obteniendo artistas: {e}")
+        if incluir_portadas:
+            # Copias: los dicts del catálogo en caché mantienen la URL
+            try:
+                productos_paginados = [
+                    {**producto, "cover": portada_en_linea(producto["cover"], catalogo["portadas"])}
+                    for producto in productos_paginados
+                ]
+            except KeyError as e:
+                # El cliente pidió la imagen incrustada: no se le envía la URL en su lugar
+                logger.error("Portada %s ausente del catálogo en caché", e)
+                return Error(code="500", message="Portada no disponible").to_dict(), 500
         
         # --- Retornar respuesta con datos paginados, metadata y catálogos ---
-        return {
-            "data": productos_paginados,
-            "pagination": {
-                "page": page,
-                "limit": limit,
-                "total": total_productos,
-                "totalPages": total_pages
-            },
-            "genres": all_genres,
-            "artists": all_artists
-        }, 200
+        paginacion = {
+            "page": page,
+            "limit": limit,
+            "total": total_productos,
+            "totalPages": total_pages
+        }
+        cuerpo = _serializar_pagina(productos_paginados, paginacion, catalogo["genres"], catalogo["artists"])
+        respuesta = Response(cuerpo, status=200, mimetype="application/json", headers=cabeceras)
+        respuesta.set_etag(etag, weak=True)
+        return respuesta
 
     except Exception as e:
-        print(f"[DEBUG] get_store_products: EXCEPCIÓN - {type(e).__name__}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error general al obtener los productos de la tienda")
         return Error(code="500", message=str(e)).to_dict(), 500
+
+
+def get_store_cover(cover_id):
+    """
+    Sirve la imagen de portada de un producto de la tienda.
+
+    Las URLs de portada las genera el catálogo de /store a partir del
+    contenido de la imagen, así que una URL nunca cambia de contenido y la
+    respuesta se marca como cacheable indefinidamente (immutable).
+
+    La portada se busca en el catálogo en caché, cargándolo de TyA si este
+    proceso no lo tiene (otro worker, reinicio o entrada expulsada): al
+    derivar la URL del contenido, la recarga vuelve a producir la misma URL.
+
+    Args:
+        cover_id (str): Hash de la portada (último segmento de su URL).
+
+    Returns:
+        Response|Error: Bytes de la imagen con su tipo MIME, o Error 404 si
+            ningún producto del catálogo actual tiene esa portada.
+    """
+    portada = _obtener_catalogo()["portadas"].get(cover_id)
+    if portada is None:
+        return Error(code="404", message="Portada no encontrada").to_dict(), 404
+    tipo, contenido = portada
+    return Response(contenido, status=200, mimetype=tipo,
+                    headers={"Cache-Control": "public, max-age=31536000, immutable",
+                             "X-Content-Type-Options": "nosniff"})
@@ -0,0 +1,144 @@
+"""
+Mapeo de productos de TyA al esquema Product de la tienda.
+
+Este módulo contiene las funciones que transforman los objetos devueltos por
+los endpoints /song/list, /album/list y /merch/list del microservicio TyA en
+dicts con las claves JSON del esquema Product (ver Product.attribute_map).
+
+Se mantiene separado del controlador para que el bucle caliente de /store
+sea código puro: sin dependencias de Flask ni de requests y sin escrituras
+en cachés (las portadas las registra el controlador). Las funciones
+mapear_* se generan al importar el módulo a partir de una tabla de campos
+por tipo (ver _generar_mapeador): cada una es un único literal dict con las
+conversiones en línea, sin dispatch por campo.
+
+Note:
+    Las funciones mapear_* se compilan con exec, por lo que mypyc no puede
+    compilarlas: si se compila el módulo con mypyc solo se benefician las
+    funciones auxiliares (_precio, _lista_enteros, ...), mientras que los
+    mapeadores generados siguen ejecutándose como bytecode de Python.
+
+Conversiones comunes:
+    - IDs numéricos que TyA envía como string se convierten a int ("" → 0)
+    - El precio admite coma decimal ("1,99" → 1.99)
+    - La fecha de lanzamiento se expresa como medianoche UTC ("...T00:00:00Z")
+    - El género es el primero de la lista de géneros de TyA
+    - La portada se copia tal cual; el controlador la sustituye después
+      por su URL en /store/covers (ver swagger_server.covers)
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _lista_enteros(valores: Optional[List[Any]]) -> Optional[List[Any]]:
+    """Convierte a int las listas de IDs que TyA envía como strings."""
+    if valores and isinstance(valores[0], str):
+        return [int(v) for v in valores if v]
+    return valores
+
+
+def _precio(valor: Any) -> float:
+    """Convierte el precio de TyA (número o string con coma decimal) a float."""
+    if isinstance(valor, str):
+        valor = valor.replace(",", ".")
+    return float(valor) if valor else 0.0
+
+
+def _genero(generos: Optional[List[Any]]) -> Any:
+    """Retorna el género principal (el primero de la lista) o 0 si no hay."""
+    generos = _lista_enteros(generos)
+    return generos[0] if generos else 0
+
+
+# --- Generación de los mapeadores ---
+# Cada tipo de producto se describe con una tabla (clave Product, plantilla,
+# clave TyA). Al importar el módulo se genera con exec una función por tipo
+# cuyo cuerpo es un único literal dict con las expresiones en línea: sin
+# bucles sobre la tabla ni llamadas por campo en el camino caliente, salvo
+# las conversiones que no caben en una expresión (precio, listas, género).
+# En las plantillas, {k} es la clave TyA y {t} una variable temporal única.
+_GET = 'o.get({k!r})'
+_ENTERO = '(int({t}) if {t} else 0) if isinstance({t} := o.get({k!r}), str) else {t}'
+_FECHA = 'str({t}) + "T00:00:00Z" if ({t} := o.get({k!r})) else None'
+_PRECIO = '_precio(o.get({k!r}, "0"))'
+_LISTA = '_lista_enteros(o.get({k!r}, []))'
+_GENERO = '_genero(o.get({k!r}, []))'
+_NULO = 'None'
+
+_CAMPOS_CANCION = (
+    ('songId', _GET, "songId"),
+    ('albumId', _GET, "albumId"),
+    ('merchId', _NULO, None),
+    ('name', _GET, "title"),
+    ('price', _PRECIO, "price"),
+    ('description', _GET, "description"),
+    ('artist', _ENTERO, "artistId"),
+    ('colaborators', _LISTA, "collaborators"),
+    ('releaseDate', _FECHA, "releaseDate"),
+    ('duration', _ENTERO, "duration"),
+    ('genre', _GENERO, "genres"),
+    ('cover', _GET, "cover"),
+    ('songList', _NULO, None),
+)
+
+_CAMPOS_ALBUM = (
+    ('songId', _NULO, None),
+    ('albumId', _GET, "albumId"),
+    ('merchId', _NULO, None),
+    ('name', _GET, "title"),
+    ('price', _PRECIO, "price"),
+    ('description', _GET, "description"),
+    ('artist', _ENTERO, "artistId"),
+    ('colaborators', _LISTA, "collaborators"),
+    ('releaseDate', _FECHA, "releaseDate"),
+    ('duration', _NULO, None),
+    ('genre', _GENERO, "genres"),
+    ('cover', _GET, "cover"),
+    ('songList', _LISTA, "songs"),
+)
+
+_CAMPOS_MERCH = (
+    ('songId', _NULO, None),
+    ('albumId', _NULO, None),
+    ('merchId', _GET, "merchId"),
+    ('name', _GET, "title"),
+    ('price', _PRECIO, "price"),
+    ('description', _GET, "description"),
+    ('artist', _ENTERO, "artistId"),
+    ('colaborators', _LISTA, "collaborators"),
+    ('releaseDate', _FECHA, "releaseDate"),
+    ('duration', _NULO, None),
+    ('genre', _NULO, None),  # Merch no tiene género en TyA
+    ('cover', _GET, "cover"),
+    ('songList', _NULO, None),
+)
+
+
+def _generar_mapeador(nombre: str, campos: Tuple[Tuple[str, str, Optional[str]], ...], doc: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Genera una función especializada que mapea un objeto TyA al esquema Product.
+
+    Args:
+        nombre (str): Nombre de la función generada.
+        campos (tuple): Tabla (clave Product, plantilla, clave TyA) del tipo.
+        doc (str): Docstring de la función generada.
+
+    Returns:
+        callable: Función ``nombre(o) -> dict``.
+    """
+    lineas = [
+        f"        {clave!r}: {plantilla.format(k=origen, t=f'_v{i}')},"
+        for i, (clave, plantilla, origen) in enumerate(campos)
+    ]
+    fuente = f"def {nombre}(o):\n    return {{\n" + "\n".join(lineas) + "\n    }\n"
+    espacio = {"_precio": _precio, "_lista_enteros": _lista_enteros, "_genero": _genero}
+    exec(compile(fuente, f"<store_mapping {nombre}>", "exec"), espacio)
+    funcion = espacio[nombre]
+    funcion.__doc__ = doc
+    funcion.__module__ = __name__
+    return funcion
+
+
+mapear_cancion = _generar_mapeador("mapear_cancion", _CAMPOS_CANCION, "Mapea una canción de TyA al esquema Product.")
+mapear_album = _generar_mapeador("mapear_album", _CAMPOS_ALBUM, "Mapea un álbum de TyA al esquema Product.")
+mapear_merch = _generar_mapeador("mapear_merch", _CAMPOS_MERCH, "Mapea un artículo de merchandising de TyA al esquema Product.")
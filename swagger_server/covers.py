@@ -0,0 +1,111 @@
+"""
+Portadas de productos.
+
+TyA envía la portada de cada producto como data URI en base64
+("data:image/png;base64,..."), de cientos de KB cada una. En lugar de
+incluirlas en cada respuesta de /store, el catálogo sustituye cada portada
+por una URL corta derivada de su contenido (/store/covers/<hash>) y guarda
+los bytes decodificados junto a los productos para servirlos desde ese
+endpoint.
+
+Características:
+    - Clave por contenido (BLAKE2b de 8 bytes): la misma imagen produce
+      siempre la misma URL, y una imagen nueva produce una URL nueva, así
+      que el navegador puede cachearla indefinidamente
+    - Cada portada distinta se decodifica una sola vez por consulta a TyA
+    - Sin almacén propio: las portadas viven en la entrada de caché del
+      catálogo que las referencia y se descartan con ella
+
+Note:
+    Al ser la URL función del contenido, cualquier proceso (o el mismo tras
+    reiniciarse) que vuelva a cargar el catálogo de TyA genera las mismas
+    URLs, así que una URL publicada sigue sirviéndose aunque la pida otro
+    worker.
+"""
+
+import base64
+import binascii
+import hashlib
+import re
+
+COVERS_URL_PREFIX = "/store/covers"
+
+# Solo se sirven desde nuestro origen imágenes rasterizadas: cualquier otro
+# tipo declarado en el data URI (text/html, image/svg+xml con scripts...)
+# se deja incrustado tal cual y nunca llega a /store/covers.
+_TIPO_IMAGEN = re.compile(r"image/[a-z0-9.+-]+")
+_TIPOS_EXCLUIDOS = frozenset({"image/svg+xml"})
+
+
+def registrar_portada(portada, portadas):
+    """
+    Guarda una portada en base64 en portadas y retorna la URL desde la que se sirve.
+
+    Args:
+        portada (str): Portada tal y como la envía TyA.
+        portadas (dict): Portadas del catálogo, por clave; se añade la nueva.
+
+    Returns:
+        str: URL /store/covers/<hash> si la portada es un data URI en base64
+            válido de una imagen rasterizada (image/*, salvo SVG); en otro
+            caso (URL, vacía, otro tipo MIME, formato desconocido) se
+            retorna sin cambios.
+    """
+    if not isinstance(portada, str) or not portada.startswith("data:"):
+        return portada
+    clave = hashlib.blake2b(portada.encode("ascii", "replace"), digest_size=8).hexdigest()
+    if clave not in portadas:
+        cabecera, _, datos = portada.partition(",")
+        if not cabecera.endswith(";base64"):
+            return portada
+        try:
+            contenido = base64.b64decode(datos)
+        except (binascii.Error, ValueError):
+            return portada
+        tipo = cabecera[5:].split(";", 1)[0].lower()
+        if not _TIPO_IMAGEN.fullmatch(tipo) or tipo in _TIPOS_EXCLUIDOS:
+            return portada
+        portadas[clave] = (tipo, contenido)
+    return f"{COVERS_URL_PREFIX}/{clave}"
+
+
+def extraer_portadas(productos):
+    """
+    Sustituye la portada de cada producto por su URL de /store/covers.
+
+    Args:
+        productos (list): Dicts del esquema Product; se modifican en el sitio.
+
+    Returns:
+        Dict[str, Tuple[str, bytes]]: Portadas referenciadas por los
+            productos, por clave (tipo MIME y bytes de la imagen).
+    """
+    portadas = {}
+    for producto in productos:
+        producto["cover"] = registrar_portada(producto["cover"], portadas)
+    return portadas
+
+
+def portada_en_linea(url, portadas):
+    """
+    Retorna como data URI en base64 la portada referenciada por url.
+
+    Inverso de registrar_portada, para los clientes que piden la portada
+    incrustada (/store?include=cover).
+
+    Args:
+        url (str): Portada del producto en el catálogo.
+        portadas (dict): Portadas del mismo catálogo.
+
+    Returns:
+        str: Data URI de la portada, o url sin cambios si no es una URL de
+            /store/covers (la portada ya venía incrustada o es externa).
+
+    Raises:
+        KeyError: Si la URL apunta a una portada que no está en portadas;
+            nunca se retorna la URL en lugar de la imagen pedida.
+    """
+    if not isinstance(url, str) or not url.startswith(COVERS_URL_PREFIX + "/"):
+        return url
+    tipo, contenido = portadas[url[len(COVERS_URL_PREFIX) + 1:]]
+    return f"data:{tipo};base64,{base64.b64encode(contenido).decode('ascii')}"
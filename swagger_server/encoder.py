@@ -1,9 +1,15 @@
+from array import array
+
 from connexion.apps.flask_app import FlaskJSONEncoder
 import six
 
 from swagger_server.models.base_model_ import Model
 
 
+# Se instala como app.json_encoder, que Connexion 2.14 (Flask >= 2.0, < 2.3)
+# sigue usando. No se sustituye por un proveedor JSON de Flask basado en
+# orjson: solo se activaría con Flask 2.2 y cambiaría el formato de las
+# respuestas (fechas con sufijo 'Z', indent ignorado).
 class JSONEncoder(FlaskJSONEncoder):
     include_nulls = False
 
@@ -17,4 +23,6 @@ class JSONEncoder(FlaskJSONEncoder):
                 attr = o.attribute_map[attr]
                 dikt[attr] = value
             return dikt
+        if isinstance(o, array):
+            return o.tolist()
         return FlaskJSONEncoder.default(self, o)
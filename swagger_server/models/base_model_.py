@@ -1,6 +1,6 @@
 import pprint
 
-import six
+import orjson
 import typing
 
 from swagger_server import util
@@ -9,6 +9,14 @@ T = typing.TypeVar('T')
 
 
 class Model(object):
+    # Convención de los modelos: cada subclase declara __slots__ con sus
+    # atributos (sin __dict__ por instancia, por eso aquí va vacío) y los
+    # guarda como atributos simples, sin property/setter por campo; los
+    # obligatorios se comprueban una sola vez en el constructor.
+    # swagger_types y attribute_map son dicts de clase compartidos por todas
+    # las instancias y no deben modificarse.
+    __slots__ = ()
+
     # swaggerTypes: The key is attribute name and the
     # value is attribute type.
     swagger_types = {}
@@ -17,37 +25,40 @@ class Model(object):
     # value is json key in definition.
     attribute_map = {}
 
+    def __init_subclass__(cls, **kwargs):
+        """Generates from_dict and to_dict for subclasses with class-level swagger_types.
+
+        Subclasses that define their own from_dict/to_dict keep them.
+        """
+        super().__init_subclass__(**kwargs)
+        if not cls.__dict__.get('swagger_types'):
+            return
+        if 'from_dict' not in cls.__dict__:
+            cls.from_dict = util.compile_from_dict(cls)
+        if 'to_dict' not in cls.__dict__:
+            cls.to_dict = util.compile_to_dict(cls)
+
     @classmethod
     def from_dict(cls: typing.Type[T], dikt) -> T:
         """Returns the dict as a model"""
         return util.deserialize_model(dikt, cls)
 
+    @classmethod
+    def from_json(cls: typing.Type[T], raw) -> T:
+        """Returns the JSON document (bytes or str) as a model
+
+        Parses with orjson and goes straight to from_dict. Request handlers
+        should use from_dict on the body Connexion already parsed instead.
+        """
+        return cls.from_dict(orjson.loads(raw))
+
     def to_dict(self):
         """Returns the model properties as a dict
 
         :rtype: dict
         """
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(map(
-                    lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                    value
-                ))
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(map(
-                    lambda item: (item[0], item[1].to_dict())
-                    if hasattr(item[1], "to_dict") else item,
-                    value.items()
-                ))
-            else:
-                result[attr] = value
-
-        return result
+        return {attr: util.serialize_value(getattr(self, attr))
+                for attr in self.swagger_types}
 
     def to_str(self):
         """Returns the string representation of the model
@@ -62,7 +73,10 @@ class Model(object):
 
     def __eq__(self, other):
         """Returns true if both objects are equal"""
-        return self.__dict__ == other.__dict__
+        if type(other) is not type(self):
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.swagger_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
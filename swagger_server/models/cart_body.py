@@ -29,7 +29,6 @@ Schema OpenAPI:
 
 from __future__ import absolute_import
 from swagger_server.models.base_model_ import Model
-from swagger_server import util
 
 
 class CartBody(Model):
@@ -68,88 +67,46 @@ class CartBody(Model):
         - Solo uno de song_id, album_id, merch_id debe estar presente (validado en controlador)
     """
 
+    # unidades usa property para validar que sea al menos 1.
+    __slots__ = ('song_id', 'album_id', 'merch_id', '_unidades')
+
+    swagger_types = {
+        'song_id': int,
+        'album_id': int,
+        'merch_id': int,
+        'unidades': int
+    }
+
+    attribute_map = {
+        'song_id': 'songId',
+        'album_id': 'albumId',
+        'merch_id': 'merchId',
+        'unidades': 'unidades'
+    }
+
     def __init__(self, song_id: int = None, album_id: int = None, merch_id: int = None, unidades: int = 1):  # noqa: E501
         """
         Constructor del modelo CartBody.
         
         Inicializa una instancia de CartBody con los datos del producto a añadir al carrito.
-        Configura los tipos de datos y el mapeo entre atributos Python y JSON.
         
         Args:
             song_id (int, optional): ID de la canción a añadir. Default: None.
             album_id (int, optional): ID del álbum a añadir. Default: None.
             merch_id (int, optional): ID del merchandising a añadir. Default: None.
             unidades (int, optional): Cantidad de unidades (solo merch). Default: 1.
+
+        Raises:
+            ValueError: Si unidades es menor que 1 (se valida en el setter).
         
         Note:
             Solo uno de los IDs (song_id, album_id, merch_id) debería tener valor.
             Esta validación se realiza en el controlador, no en el modelo.
         """
-        self.swagger_types = {
-            'song_id': int,
-            'album_id': int,
-            'merch_id': int,
-            'unidades': int
-        }
-
-        self.attribute_map = {
-            'song_id': 'songId',
-            'album_id': 'albumId',
-            'merch_id': 'merchId',
-            'unidades': 'unidades'
-        }
-
-        self._song_id = song_id
-        self._album_id = album_id
-        self._merch_id = merch_id
-        self._unidades = unidades or 1
-
-    @classmethod
-    def from_dict(cls, dikt) -> 'CartBody':
-        """
-        Crea una instancia de CartBody desde un diccionario.
-        
-        Deserializa un diccionario (típicamente desde JSON) en un objeto CartBody,
-        mapeando correctamente los nombres de campos JSON a atributos Python.
-        
-        Args:
-            dikt (dict): Diccionario con los datos del producto.
-                        Puede contener: songId, albumId, merchId, unidades.
-        
-        Returns:
-            CartBody: Nueva instancia con los datos deserializados.
-        
-        Example:
-            >>> data = {"merchId": 5, "unidades": 2}
-            >>> cart_item = CartBody.from_dict(data)
-            >>> cart_item.merch_id  # 5
-            >>> cart_item.unidades  # 2
-        """
-        return util.deserialize_model(dikt, cls)
-
-    @property
-    def song_id(self) -> int:
-        return self._song_id
-
-    @song_id.setter
-    def song_id(self, song_id: int):
-        self._song_id = song_id
-
-    @property
-    def album_id(self) -> int:
-        return self._album_id
-
-    @album_id.setter
-    def album_id(self, album_id: int):
-        self._album_id = album_id
-
-    @property
-    def merch_id(self) -> int:
-        return self._merch_id
-
-    @merch_id.setter
-    def merch_id(self, merch_id: int):
-        self._merch_id = merch_id
+        self.song_id = song_id
+        self.album_id = album_id
+        self.merch_id = merch_id
+        self.unidades = unidades
 
     @property
     def unidades(self) -> int:
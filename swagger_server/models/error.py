@@ -32,7 +32,6 @@ from datetime import date, datetime  # noqa: F401
 from typing import List, Dict  # noqa: F401
 
 from swagger_server.models.base_model_ import Model
-from swagger_server import util
 
 
 class Error(Model):
@@ -71,102 +70,40 @@ class Error(Model):
     
     Validation:
         Ambos campos son obligatorios. Intentar crear una instancia sin
-        code o message lanzará ValueError al usar los setters.
+        code o message lanza ValueError en el constructor.
     
     Note:
         Este modelo es generado automáticamente por Swagger Codegen.
         Modificaciones manuales pueden perderse al regenerar.
     """
+    __slots__ = ('code', 'message')
+
+    swagger_types = {
+        'code': str,
+        'message': str
+    }
+
+    attribute_map = {
+        'code': 'code',
+        'message': 'message'
+    }
+
     def __init__(self, code: str=None, message: str=None):  # noqa: E501
         """
         Constructor del modelo Error.
         
         Inicializa una instancia de Error con código y mensaje.
-        Configura los tipos de datos y el mapeo entre atributos Python y JSON.
         
         Args:
             code (str): Código de error. Típicamente un código HTTP como "400", "500".
             message (str): Mensaje descriptivo del error para debugging o usuario.
         
-        Note:
-            Ambos parámetros son técnicamente opcionales en el constructor,
-            pero se vuelven obligatorios al usar los setters (lanzan ValueError si son None).
-        """
-        self.swagger_types = {
-            'code': str,
-            'message': str
-        }
-
-        self.attribute_map = {
-            'code': 'code',
-            'message': 'message'
-        }
-        self._code = code
-        self._message = message
-
-    @classmethod
-    def from_dict(cls, dikt) -> 'Error':
-        """
-        Crea una instancia de Error desde un diccionario.
-        
-        Deserializa un diccionario en un objeto Error, útil para procesar
-        errores recibidos de otros servicios o para testing.
-        
-        Args:
-            dikt (dict): Diccionario con los datos del error.
-                        Debe contener: code y message.
-        
-        Returns:
-            Error: Nueva instancia con los datos deserializados.
-        
-        Example:
-            >>> error_data = {"code": "404", "message": "Not found"}
-            >>> error = Error.from_dict(error_data)
-        """
-        return util.deserialize_model(dikt, cls)
-
-    @property
-    def code(self) -> str:
-        """Gets the code of this Error.
-
-
-        :return: The code of this Error.
-        :rtype: str
-        """
-        return self._code
-
-    @code.setter
-    def code(self, code: str):
-        """Sets the code of this Error.
-
-
-        :param code: The code of this Error.
-        :type code: str
+        Raises:
+            ValueError: Si code o message es None.
         """
         if code is None:
             raise ValueError("Invalid value for `code`, must not be `None`")  # noqa: E501
-
-        self._code = code
-
-    @property
-    def message(self) -> str:
-        """Gets the message of this Error.
-
-
-        :return: The message of this Error.
-        :rtype: str
-        """
-        return self._message
-
-    @message.setter
-    def message(self, message: str):
-        """Sets the message of this Error.
-
-
-        :param message: The message of this Error.
-        :type message: str
-        """
         if message is None:
             raise ValueError("Invalid value for `message`, must not be `None`")  # noqa: E501
-
-        self._message = message
+        self.code = code
+        self.message = message
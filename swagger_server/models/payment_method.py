@@ -34,12 +34,13 @@ Compliance:
 """
 
 from __future__ import absolute_import
-from datetime import date, datetime  # noqa: F401
 
 from typing import List, Dict  # noqa: F401
 
 from swagger_server.models.base_model_ import Model
-from swagger_server import util
+
+# Meses válidos como máscara de bits: bits 1..12 activos
+_VALID_MONTH_MASK = 0x1FFE
 
 
 class PaymentMethod(Model):
@@ -67,8 +68,9 @@ class PaymentMethod(Model):
         - card_holder ↔ cardHolder
     
     Validation:
-        - Todos los campos son obligatorios
-        - expire_month debe estar entre 1 y 12 (validado en API spec)
+        - Todos los campos salvo id son obligatorios (ValueError en el constructor)
+        - expire_month debe estar entre 1 y 12 (validado en API spec y en
+          validar_entrada al dar de alta un método de pago)
         - card_number debe estar enmascarado antes de llegar al backend
     
     Examples:
@@ -101,12 +103,29 @@ class PaymentMethod(Model):
         Este modelo es generado automáticamente por Swagger Codegen.
         La información de seguridad es crítica - revisar antes de modificar.
     """
+    __slots__ = ('id', 'card_number', 'expire_month', 'expire_year', 'card_holder')
+
+    swagger_types = {
+        'id': int,
+        'card_number': str,
+        'expire_month': int,
+        'expire_year': int,
+        'card_holder': str
+    }
+
+    attribute_map = {
+        'id': 'id',
+        'card_number': 'cardNumber',
+        'expire_month': 'expireMonth',
+        'expire_year': 'expireYear',
+        'card_holder': 'cardHolder'
+    }
+
     def __init__(self, id: int=None, card_number: str=None, expire_month: int=None, expire_year: int=None, card_holder: str=None):  # noqa: E501
         """
         Constructor del modelo PaymentMethod.
         
         Inicializa una instancia de PaymentMethod con la información de la tarjeta.
-        Configura los tipos de datos y el mapeo entre atributos Python y JSON.
         
         Args:
             id (int): Unique identifier of the payment method.
@@ -118,177 +137,45 @@ class PaymentMethod(Model):
         Security:
             El card_number DEBE venir ya enmascarado. No aceptar números completos.
         
-        Note:
-            Todos los parámetros son técnicamente opcionales en el constructor,
-            pero se vuelven obligatorios al usar los setters.
+        Raises:
+            ValueError: Si falta algún campo obligatorio (todos salvo id).
         """
-        self.swagger_types = {
-            'id': int,
-            'card_number': str,
-            'expire_month': int,
-            'expire_year': int,
-            'card_holder': str
-        }
-
-        self.attribute_map = {
-            'id': 'id',
-            'card_number': 'cardNumber',
-            'expire_month': 'expireMonth',
-            'expire_year': 'expireYear',
-            'card_holder': 'cardHolder'
-        }
-        self._id = id
-        self._card_number = card_number
-        self._expire_month = expire_month
-        self._expire_year = expire_year
-        self._card_holder = card_holder
-
-    @classmethod
-    def from_dict(cls, dikt) -> 'PaymentMethod':
+        self.id = id
+        self.card_number = card_number
+        self.expire_month = expire_month
+        self.expire_year = expire_year
+        self.card_holder = card_holder
+        self._validate()
+
+    def _validate(self):
         """
-        Crea una instancia de PaymentMethod desde un diccionario.
-        
-        Deserializa un diccionario (típicamente desde JSON) en un objeto PaymentMethod,
-        mapeando correctamente los nombres de campos JSON a atributos Python.
-        
-        Args:
-            dikt (dict): Diccionario con los datos del método de pago.
-                        Debe contener: id, cardNumber, expireMonth, expireYear, cardHolder.
-        
-        Returns:
-            PaymentMethod: Nueva instancia con los datos deserializados.
-        
-        Example:
-            >>> data = {
-            ...     "id": 1,
-            ...     "cardNumber": "**** **** **** 1234",
-            ...     "expireMonth": 12,
-            ...     "expireYear": 2025,
-            ...     "cardHolder": "Juan Pérez"
-            ... }
-            >>> payment = PaymentMethod.from_dict(data)
-        """
-        return util.deserialize_model(dikt, cls)
+        Comprueba de una vez los campos obligatorios.
 
-    @property
-    def id(self) -> int:
-        """Gets the id of this PaymentMethod.
+        El rango de expire_month lo valida Connexion sobre el cuerpo de la
+        petición; aquí no se comprueba para que una fila antigua de la base
+        de datos no impida listar los métodos de pago.
 
-        Unique identifier of the payment method.  # noqa: E501
-
-        :return: The id of this PaymentMethod.
-        :rtype: int
+        Raises:
+            ValueError: Si falta un campo obligatorio.
         """
-        return self._id
-
-    @id.setter
-    def id(self, id: int):
-        """Sets the id of this PaymentMethod.
-
-        Unique identifier of the payment method.  # noqa: E501
-
-        :param id: The id of this PaymentMethod.
-        :type id: int
-        """
-
-        self._id = id
-
-    @property
-    def card_number(self) -> str:
-        """Gets the card_number of this PaymentMethod.
-
-        Masked card number.  # noqa: E501
-
-        :return: The card_number of this PaymentMethod.
-        :rtype: str
-        """
-        return self._card_number
-
-    @card_number.setter
-    def card_number(self, card_number: str):
-        """Sets the card_number of this PaymentMethod.
-
-        Masked card number.  # noqa: E501
-
-        :param card_number: The card_number of this PaymentMethod.
-        :type card_number: str
-        """
-        if card_number is None:
+        if self.card_number is None:
             raise ValueError("Invalid value for `card_number`, must not be `None`")  # noqa: E501
-
-        self._card_number = card_number
-
-    @property
-    def expire_month(self) -> int:
-        """Gets the expire_month of this PaymentMethod.
-
-        Expire month of the card.  # noqa: E501
-
-        :return: The expire_month of this PaymentMethod.
-        :rtype: int
-        """
-        return self._expire_month
-
-    @expire_month.setter
-    def expire_month(self, expire_month: int):
-        """Sets the expire_month of this PaymentMethod.
-
-        Expire month of the card.  # noqa: E501
-
-        :param expire_month: The expire_month of this PaymentMethod.
-        :type expire_month: int
-        """
-        if expire_month is None:
+        if self.expire_month is None:
             raise ValueError("Invalid value for `expire_month`, must not be `None`")  # noqa: E501
-
-        self._expire_month = expire_month
-
-    @property
-    def expire_year(self) -> int:
-        """Gets the expire_year of this PaymentMethod.
-
-        Expire year of the card.  # noqa: E501
-
-        :return: The expire_year of this PaymentMethod.
-        :rtype: int
-        """
-        return self._expire_year
-
-    @expire_year.setter
-    def expire_year(self, expire_year: int):
-        """Sets the expire_year of this PaymentMethod.
-
-        Expire year of the card.  # noqa: E501
-
-        :param expire_year: The expire_year of this PaymentMethod.
-        :type expire_year: int
-        """
-        if expire_year is None:
+        if self.expire_year is None:
             raise ValueError("Invalid value for `expire_year`, must not be `None`")  # noqa: E501
+        if self.card_holder is None:
+            raise ValueError("Invalid value for `card_holder`, must not be `None`")  # noqa: E501
 
-        self._expire_year = expire_year
-
-    @property
-    def card_holder(self) -> str:
-        """Gets the card_holder of this PaymentMethod.
-
-        Name of the card  # noqa: E501
-
-        :return: The card_holder of this PaymentMethod.
-        :rtype: str
+    def validar_entrada(self):
         """
-        return self._card_holder
+        Comprueba los rangos de un método de pago que llega en una petición.
 
-    @card_holder.setter
-    def card_holder(self, card_holder: str):
-        """Sets the card_holder of this PaymentMethod.
+        No forma parte de _validate para que las filas ya guardadas en la
+        base de datos se puedan listar aunque estén fuera de rango.
 
-        Name of the card  # noqa: E501
-
-        :param card_holder: The card_holder of this PaymentMethod.
-        :type card_holder: str
+        Raises:
+            ValueError: Si expire_month no está entre 1 y 12.
         """
-        if card_holder is None:
-            raise ValueError("Invalid value for `card_holder`, must not be `None`")  # noqa: E501
-
-        self._card_holder = card_holder
+        if self.expire_month < 0 or not (_VALID_MONTH_MASK >> self.expire_month) & 1:
+            raise ValueError("Invalid value for `expire_month`, must be a value between 1 and 12")  # noqa: E501
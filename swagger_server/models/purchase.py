@@ -41,12 +41,28 @@ Use Case:
 """
 
 from __future__ import absolute_import
+from array import array
 from datetime import date, datetime  # noqa: F401
 
-from typing import List, Dict  # noqa: F401
+from typing import List, Dict, Optional, Sequence  # noqa: F401
 
 from swagger_server.models.base_model_ import Model
-from swagger_server import util
+
+
+def _ids(valores: Optional[Sequence[int]]) -> Optional[array]:
+    """
+    Empaqueta una lista de IDs en un array de int32 (None se mantiene).
+
+    Raises:
+        ValueError: Si algún ID no cabe en un int32 (fuera de [-2**31, 2**31 - 1]),
+                    el mismo rango que el INTEGER de la base de datos.
+    """
+    if valores is None or type(valores) is array:
+        return valores
+    try:
+        return array('i', valores)
+    except OverflowError:
+        raise ValueError("Los IDs deben estar en el rango de un entero de 32 bits")
 
 
 class Purchase(Model):
@@ -64,12 +80,17 @@ class Purchase(Model):
                                  Requerido.
         payment_method_id (int): ID del método de pago utilizado. Debe corresponder
                                 a un PaymentMethod válido del usuario. Requerido.
-        song_ids (List[int], optional): Lista de IDs de canciones compradas.
+        song_ids (array[int], optional): IDs de canciones compradas.
                                        Puede estar vacía si no se compraron canciones.
-        album_ids (List[int], optional): Lista de IDs de álbumes comprados.
+        album_ids (array[int], optional): IDs de álbumes comprados.
                                         Puede estar vacía si no se compraron álbumes.
-        merch_ids (List[int], optional): Lista de IDs de merchandising comprado.
+        merch_ids (array[int], optional): IDs de merchandising comprado.
                                         Puede estar vacía si no se compró merch.
+
+    Note:
+        Las listas de IDs se guardan como array('i') (4 bytes por ID, como
+        el INTEGER de la base de datos) en lugar de listas de int de Python;
+        se convierten de nuevo a listas al serializar a JSON.
     
     JSON Mapping:
         - purchase_price ↔ purchasePrice
@@ -131,215 +152,95 @@ class Purchase(Model):
         Este modelo es generado automáticamente por Swagger Codegen.
         La lógica de validación de precios y productos existe en el controlador.
     """
-    def __init__(self, purchase_price: float=None, purchase_date: datetime=None, payment_method_id: int=None, song_ids: List[int]=None, album_ids: List[int]=None, merch_ids: List[int]=None):  # noqa: E501
+
+    __slots__ = ('purchase_price', 'purchase_date', 'payment_method_id',
+                 'song_ids', 'album_ids', 'merch_ids')
+
+    swagger_types = {
+        'purchase_price': float,
+        'purchase_date': datetime,
+        'payment_method_id': int,
+        'song_ids': List[int],
+        'album_ids': List[int],
+        'merch_ids': List[int]
+    }
+
+    attribute_map = {
+        'purchase_price': 'purchasePrice',
+        'purchase_date': 'purchaseDate',
+        'payment_method_id': 'paymentMethodId',
+        'song_ids': 'songIds',
+        'album_ids': 'albumIds',
+        'merch_ids': 'merchIds'
+    }
+
+    def __init__(self, purchase_price: float=None, purchase_date: datetime=None, payment_method_id: int=None, song_ids: Sequence[int]=None, album_ids: Sequence[int]=None, merch_ids: Sequence[int]=None):  # noqa: E501
         """
         Constructor del modelo Purchase.
         
         Inicializa una instancia de Purchase con todos los datos de la compra.
-        Configura los tipos de datos y el mapeo entre atributos Python y JSON.
         
         Args:
             purchase_price (float): Importe total de la compra.
             purchase_date (datetime): Fecha y hora de la compra.
             payment_method_id (int): ID del método de pago utilizado.
-            song_ids (List[int], optional): Lista de IDs de canciones compradas.
-            album_ids (List[int], optional): Lista de IDs de álbumes comprados.
-            merch_ids (List[int], optional): Lista de IDs de merchandising comprado.
+            song_ids (Sequence[int], optional): IDs de canciones compradas.
+            album_ids (Sequence[int], optional): IDs de álbumes comprados.
+            merch_ids (Sequence[int], optional): IDs de merchandising comprado.
         
+        Raises:
+            ValueError: Si falta purchase_price, purchase_date o payment_method_id,
+                        o si algún ID no cabe en un int32.
+
         Note:
             Las listas de IDs pueden ser None o listas vacías.
             Al menos una debería contener elementos para una compra válida.
         """
-        self.swagger_types = {
-            'purchase_price': float,
-            'purchase_date': datetime,
-            'payment_method_id': int,
-            'song_ids': List[int],
-            'album_ids': List[int],
-            'merch_ids': List[int]
-        }
+        self.purchase_price = purchase_price
+        self.purchase_date = purchase_date
+        self.payment_method_id = payment_method_id
+        self.song_ids = _ids(song_ids)
+        self.album_ids = _ids(album_ids)
+        self.merch_ids = _ids(merch_ids)
+        self._validate()
 
-        self.attribute_map = {
-            'purchase_price': 'purchasePrice',
-            'purchase_date': 'purchaseDate',
-            'payment_method_id': 'paymentMethodId',
-            'song_ids': 'songIds',
-            'album_ids': 'albumIds',
-            'merch_ids': 'merchIds'
-        }
-        self._purchase_price = purchase_price
-        self._purchase_date = purchase_date
-        self._payment_method_id = payment_method_id
-        self._song_ids = song_ids
-        self._album_ids = album_ids
-        self._merch_ids = merch_ids
-
-    @classmethod
-    def from_dict(cls, dikt) -> 'Purchase':
+    def _validate(self):
         """
-        Crea una instancia de Purchase desde un diccionario.
-        
-        Deserializa un diccionario (típicamente desde JSON) en un objeto Purchase,
-        mapeando correctamente todos los campos de la compra.
-        
-        Args:
-            dikt (dict): Diccionario con los datos de la compra.
-                        Debe contener purchasePrice, purchaseDate, paymentMethodId.
-                        Opcionalmente: songIds, albumIds, merchIds.
-        
-        Returns:
-            Purchase: Nueva instancia con los datos deserializados.
-        
-        Example:
-            >>> data = {
-            ...     "purchasePrice": 29.97,
-            ...     "purchaseDate": "2024-11-16T14:30:00Z",
-            ...     "paymentMethodId": 3,
-            ...     "songIds": [1, 5, 12],
-            ...     "albumIds": [2],
-            ...     "merchIds": []
-            ... }
-            >>> purchase = Purchase.from_dict(data)
-        """
-        return util.deserialize_model(dikt, cls)
-
-    @property
-    def purchase_price(self) -> float:
-        """Gets the purchase_price of this Purchase.
-
-        Price of the Song  # noqa: E501
-
-        :return: The purchase_price of this Purchase.
-        :rtype: float
-        """
-        return self._purchase_price
-
-    @purchase_price.setter
-    def purchase_price(self, purchase_price: float):
-        """Sets the purchase_price of this Purchase.
+        Comprueba de una vez los campos obligatorios.
 
-        Price of the Song  # noqa: E501
-
-        :param purchase_price: The purchase_price of this Purchase.
-        :type purchase_price: float
+        Raises:
+            ValueError: Si falta un campo obligatorio.
         """
-        if purchase_price is None:
+        if self.purchase_price is None:
             raise ValueError("Invalid value for `purchase_price`, must not be `None`")  # noqa: E501
-
-        self._purchase_price = purchase_price
-
-    @property
-    def purchase_date(self) -> datetime:
-        """Gets the purchase_date of this Purchase.
-
-        Date of the purchase  # noqa: E501
-
-        :return: The purchase_date of this Purchase.
-        :rtype: datetime
-        """
-        return self._purchase_date
-
-    @purchase_date.setter
-    def purchase_date(self, purchase_date: datetime):
-        """Sets the purchase_date of this Purchase.
-
-        Date of the purchase  # noqa: E501
-
-        :param purchase_date: The purchase_date of this Purchase.
-        :type purchase_date: datetime
-        """
-        if purchase_date is None:
+        if self.purchase_date is None:
             raise ValueError("Invalid value for `purchase_date`, must not be `None`")  # noqa: E501
-
-        self._purchase_date = purchase_date
-
-    @property
-    def payment_method_id(self) -> int:
-        """Gets the payment_method_id of this Purchase.
-
-        id of the payment method  # noqa: E501
-
-        :return: The payment_method_id of this Purchase.
-        :rtype: int
-        """
-        return self._payment_method_id
-
-    @payment_method_id.setter
-    def payment_method_id(self, payment_method_id: int):
-        """Sets the payment_method_id of this Purchase.
-
-        id of the payment method  # noqa: E501
-
-        :param payment_method_id: The payment_method_id of this Purchase.
-        :type payment_method_id: int
-        """
-        if payment_method_id is None:
+        if self.payment_method_id is None:
             raise ValueError("Invalid value for `payment_method_id`, must not be `None`")  # noqa: E501
 
-        self._payment_method_id = payment_method_id
-
-    @property
-    def song_ids(self) -> List[int]:
-        """Gets the song_ids of this Purchase.
-
-        List of song IDs to purchase  # noqa: E501
-
-        :return: The song_ids of this Purchase.
-        :rtype: List[int]
-        """
-        return self._song_ids
-
-    @song_ids.setter
-    def song_ids(self, song_ids: List[int]):
-        """Sets the song_ids of this Purchase.
-
-        List of song IDs to purchase  # noqa: E501
-
-        :param song_ids: The song_ids of this Purchase.
-        :type song_ids: List[int]
-        """
-        self._song_ids = song_ids
-
-    @property
-    def album_ids(self) -> List[int]:
-        """Gets the album_ids of this Purchase.
-
-        List of album IDs to purchase  # noqa: E501
-
-        :return: The album_ids of this Purchase.
-        :rtype: List[int]
-        """
-        return self._album_ids
-
-    @album_ids.setter
-    def album_ids(self, album_ids: List[int]):
-        """Sets the album_ids of this Purchase.
-
-        List of album IDs to purchase  # noqa: E501
-
-        :param album_ids: The album_ids of this Purchase.
-        :type album_ids: List[int]
-        """
-        self._album_ids = album_ids
-
-    @property
-    def merch_ids(self) -> List[int]:
-        """Gets the merch_ids of this Purchase.
-
-        List of merch IDs to purchase  # noqa: E501
-
-        :return: The merch_ids of this Purchase.
-        :rtype: List[int]
+    @classmethod
+    def from_trusted_dict(cls, dikt) -> 'Purchase':
         """
-        return self._merch_ids
+        Crea una instancia de Purchase desde un diccionario ya validado.
 
-    @merch_ids.setter
-    def merch_ids(self, merch_ids: List[int]):
-        """Sets the merch_ids of this Purchase.
+        Equivalente a from_dict pero sin conversión de tipos ni validación:
+        los valores se asignan tal cual, salvo las listas de IDs, que se
+        empaquetan igual que en el constructor. Reservado para datos generados por
+        el propio servicio (cachés, fixtures); la entrada HTTP debe pasar
+        siempre por from_dict/from_json.
 
-        List of merch IDs to purchase  # noqa: E501
+        Args:
+            dikt (dict): Diccionario con las claves JSON de Purchase y los
+                         valores ya en su tipo final (purchaseDate como datetime).
 
-        :param merch_ids: The merch_ids of this Purchase.
-        :type merch_ids: List[int]
-        """
-        self._merch_ids = merch_ids
+        Returns:
+            Purchase: Nueva instancia con los valores del diccionario.
+        """
+        obj = cls.__new__(cls)
+        obj.purchase_price = dikt['purchasePrice']
+        obj.purchase_date = dikt['purchaseDate']
+        obj.payment_method_id = dikt['paymentMethodId']
+        obj.song_ids = _ids(dikt.get('songIds'))
+        obj.album_ids = _ids(dikt.get('albumIds'))
+        obj.merch_ids = _ids(dikt.get('merchIds'))
+        return obj
@@ -0,0 +1,42 @@
+"""
+Carga de la especificación OpenAPI del servicio.
+
+Connexion acepta la especificación como ruta a un fichero (que parsea en
+cada add_api, con PyYAML en Python puro y pasando por Jinja2) o como dict
+ya cargado. Este módulo parsea swagger.yaml una sola vez por proceso con
+el cargador en C de libyaml cuando está disponible, y ese dict es el que
+se pasa a add_api tanto en la aplicación como en los tests.
+
+Note:
+    swagger.yaml no usa plantillas Jinja2, por lo que cargarlo directamente
+    es equivalente a la carga de Connexion. Connexion copia el dict al
+    construir la API, así que el dict compartido no se modifica.
+"""
+
+import functools
+import os
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML sin libyaml
+    from yaml import SafeLoader as _Loader
+
+SPEC_PATH = os.path.join(os.path.dirname(__file__), 'swagger', 'swagger.yaml')
+
+
+@functools.lru_cache(maxsize=None)
+def cargar_spec(ruta=SPEC_PATH):
+    """
+    Retorna la especificación OpenAPI como dict, parseada una vez por ruta.
+
+    Args:
+        ruta (str, optional): Fichero YAML de la especificación.
+                              Por defecto swagger/swagger.yaml.
+
+    Returns:
+        dict: Especificación lista para connexion.App.add_api.
+    """
+    with open(ruta, 'rb') as fichero:
+        return yaml.load(fichero, Loader=_Loader)
@@ -1,25 +1,42 @@
 import logging
 import os
 
-import connexion
 from flask_testing import TestCase
 from unittest.mock import patch, MagicMock
 
-from swagger_server.encoder import JSONEncoder
+from swagger_server.spec import cargar_spec
 
 
 class BaseTestCase(TestCase):
 
-    def create_app(self):
-        # Activar modo testing
-        os.environ['TESTING'] = 'true'
-        
+    # La app de Connexion (spec parseada y validadores) se construye una sola
+    # vez y se comparte entre todos los tests
+    _cached_app = None
+
+    @staticmethod
+    def _build_app():
+        # Connexion (y el encoder, que depende de él) se importan aquí y no
+        # al importar el paquete de tests
+        import connexion
+        from swagger_server.encoder import JSONEncoder
+
         logging.getLogger('connexion.operation').setLevel('ERROR')
         app = connexion.App(__name__, specification_dir='../swagger/')
         app.app.json_encoder = JSONEncoder
-        app.add_api('swagger.yaml', validate_responses=False)
+        app.add_api(cargar_spec(), validate_responses=False, pythonic_params=True)
         return app.app
+
+    def create_app(self):
+        # Activar modo testing (solo si no lo estaba ya)
+        self._set_testing = os.environ.get('TESTING') != 'true'
+        if self._set_testing:
+            os.environ['TESTING'] = 'true'
+
+        if BaseTestCase._cached_app is None:
+            BaseTestCase._cached_app = self._build_app()
+        return BaseTestCase._cached_app
     
     def tearDown(self):
-        # Desactivar modo testing al terminar
-        os.environ.pop('TESTING', None)
+        # Desactivar modo testing al terminar, si lo activó este test
+        if self._set_testing:
+            os.environ.pop('TESTING', None)
@@ -7,8 +7,8 @@ os.environ['TESTING'] = 'true'  # Activar modo test antes de importar
 from unittest.mock import patch
 
 from flask import json
-from six import BytesIO
 
+from swagger_server.controllers import cart_controller
 from swagger_server.models.cart_body import CartBody  # noqa: E501
 from swagger_server.models.error import Error  # noqa: E501
 from swagger_server.models.product import Product  # noqa: E501
@@ -87,6 +87,21 @@ class TestCartController(BaseTestCase):
         
         self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
 
+    def test_cached_product_cannot_be_mutated(self):
+        """Los Product compartidos por la caché del carrito no se pueden modificar
+
+        Una petición que intente cambiar un producto en caché falla en lugar
+        de alterar lo que reciben las siguientes.
+        """
+        contenido = json.dumps({"songId": 1, "title": "Test Song", "price": 1.99}).encode()
+        producto = cart_controller._producto_desde_tya(cart_controller._producto_cancion, contenido)
+        with self.assertRaises(AttributeError):
+            producto.price = 0.0
+
+        reutilizado = cart_controller._producto_desde_tya(cart_controller._producto_cancion, contenido)
+        self.assertIs(reutilizado, producto)
+        self.assertEqual(reutilizado.price, 1.99)
+
     def test_cart_without_auth(self):
         """Test case for cart operations without authentication
         
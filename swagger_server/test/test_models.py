@@ -0,0 +1,205 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+import unittest
+from array import array
+from datetime import datetime, timezone
+from typing import List
+
+from swagger_server import util
+from swagger_server.models import CartBody, Error, PaymentMethod, Product, Purchase
+from swagger_server.models.base_model_ import Model
+
+
+class _Respuesta(Model):
+    """Modelo de prueba con modelos anidados."""
+    __slots__ = ('error', 'errores')
+
+    swagger_types = {'error': Error, 'errores': List[Error]}
+    attribute_map = {'error': 'error', 'errores': 'errores'}
+
+    def __init__(self, error: Error=None, errores: List[Error]=None):
+        self.error = error
+        self.errores = errores
+
+
+class TestModels(unittest.TestCase):
+    """Tests unitarios de from_dict/to_dict de los modelos"""
+
+    def test_cart_body_round_trip(self):
+        """CartBody: from_dict/to_dict con las mismas claves que antes"""
+        self.assertEqual(CartBody.from_dict({'merchId': 5, 'unidades': 2}).to_dict(),
+                         {'song_id': None, 'album_id': None, 'merch_id': 5, 'unidades': 2})
+        # Sin unidades se usa 1 por defecto
+        self.assertEqual(CartBody.from_dict({'songId': 7}).to_dict(),
+                         {'song_id': 7, 'album_id': None, 'merch_id': None, 'unidades': 1})
+
+    def test_cart_body_invalid_unidades(self):
+        """CartBody: unidades menor que 1 se rechaza"""
+        with self.assertRaises(ValueError):
+            CartBody.from_dict({'merchId': 5, 'unidades': 0})
+
+    def test_error_round_trip(self):
+        """Error: from_dict/to_dict"""
+        self.assertEqual(Error.from_dict({'code': '404', 'message': 'Not found'}).to_dict(),
+                         {'code': '404', 'message': 'Not found'})
+
+    def test_payment_method_round_trip(self):
+        """PaymentMethod: from_dict/to_dict"""
+        data = {
+            'id': 1,
+            'cardNumber': '**** **** **** 1234',
+            'expireMonth': 12,
+            'expireYear': 2030,
+            'cardHolder': 'Ana'
+        }
+        self.assertEqual(PaymentMethod.from_dict(data).to_dict(), {
+            'id': 1,
+            'card_number': '**** **** **** 1234',
+            'expire_month': 12,
+            'expire_year': 2030,
+            'card_holder': 'Ana'
+        })
+
+    def test_payment_method_out_of_range_row(self):
+        """PaymentMethod: el constructor no valida rangos (filas ya guardadas)"""
+        payment = PaymentMethod(id=1, card_number='**** 1234', expire_month=13,
+                                expire_year=27, card_holder='')
+        self.assertEqual(payment.expire_month, 13)
+
+    def test_payment_method_validar_entrada(self):
+        """PaymentMethod: validar_entrada acepta solo meses de 1 a 12"""
+        for mes in range(1, 13):
+            PaymentMethod(card_number='**** 1234', expire_month=mes, expire_year=2030,
+                          card_holder='Ana').validar_entrada()
+        for mes in (-1, 0, 13, 64):
+            with self.subTest(mes=mes):
+                with self.assertRaises(ValueError):
+                    PaymentMethod(card_number='**** 1234', expire_month=mes, expire_year=2030,
+                                  card_holder='Ana').validar_entrada()
+
+    def test_product_round_trip(self):
+        """Product: from_dict/to_dict, con las listas de IDs como listas"""
+        data = {
+            'albumId': 10,
+            'name': 'A',
+            'price': 9.99,
+            'description': 'd',
+            'artist': 12,
+            'colaborators': [3, 4],
+            'releaseDate': '2024-11-16T00:00:00Z',
+            'genre': 2,
+            'cover': '/store/covers/x',
+            'songList': [42, 43]
+        }
+        self.assertEqual(Product.from_dict(data).to_dict(), {
+            'song_id': None,
+            'album_id': 10,
+            'merch_id': None,
+            'name': 'A',
+            'price': 9.99,
+            'description': 'd',
+            'artist': 12,
+            'colaborators': [3, 4],
+            'release_date': datetime(2024, 11, 16, tzinfo=timezone.utc),
+            'duration': None,
+            'genre': 2,
+            'cover': '/store/covers/x',
+            'song_list': [42, 43]
+        })
+
+    def test_product_immutable(self):
+        """Product: los atributos no se pueden reasignar ni borrar"""
+        producto = Product(song_id=1, name='A', price=1.99, colaborators=[3])
+        with self.assertRaises(AttributeError):
+            producto.price = 0.0
+        with self.assertRaises(AttributeError):
+            del producto.name
+        self.assertEqual(producto.price, 1.99)
+        self.assertEqual(producto.colaborators, (3,))
+
+    def test_purchase_round_trip(self):
+        """Purchase: from_dict/to_dict, con los IDs guardados en array('i')"""
+        data = {
+            'purchasePrice': 29.97,
+            'purchaseDate': '2024-11-16T14:30:00Z',
+            'paymentMethodId': 3,
+            'songIds': [1, 5, 12],
+            'albumIds': [2],
+            'merchIds': []
+        }
+        purchase = Purchase.from_dict(data)
+        self.assertIsInstance(purchase.song_ids, array)
+        self.assertEqual(purchase.to_dict(), {
+            'purchase_price': 29.97,
+            'purchase_date': datetime(2024, 11, 16, 14, 30, tzinfo=timezone.utc),
+            'payment_method_id': 3,
+            'song_ids': [1, 5, 12],
+            'album_ids': [2],
+            'merch_ids': []
+        })
+        self.assertEqual(Purchase.from_dict(data), purchase)
+
+    def test_purchase_datetime_passthrough(self):
+        """Purchase: una fecha que ya es datetime se conserva tal cual"""
+        fecha = datetime(2024, 11, 16, 14, 30)
+        self.assertIs(util.deserialize_datetime(fecha), fecha)
+        purchase = Purchase.from_dict({'purchasePrice': 1.0, 'purchaseDate': fecha,
+                                       'paymentMethodId': 1})
+        self.assertIs(purchase.purchase_date, fecha)
+
+    def test_purchase_from_trusted_dict(self):
+        """Purchase: from_trusted_dict empaqueta los IDs igual que el constructor"""
+        data = {
+            'purchasePrice': 29.97,
+            'purchaseDate': datetime(2024, 11, 16, 14, 30, tzinfo=timezone.utc),
+            'paymentMethodId': 3,
+            'songIds': [1, 5, 12],
+            'albumIds': [2],
+            'merchIds': []
+        }
+        purchase = Purchase.from_trusted_dict(data)
+        self.assertIsInstance(purchase.song_ids, array)
+        self.assertEqual(purchase, Purchase.from_dict(data))
+
+    def test_purchase_id_out_of_range(self):
+        """Purchase: un ID fuera de int32 lanza ValueError"""
+        with self.assertRaises(ValueError):
+            Purchase(purchase_price=1.0, purchase_date=datetime(2024, 11, 16),
+                     payment_method_id=1, song_ids=[2 ** 31])
+
+    def test_missing_required_fields(self):
+        """Los campos obligatorios ausentes lanzan ValueError"""
+        casos = [
+            (Error, {'code': '400'}),
+            (PaymentMethod, {'cardNumber': '**** 1234', 'expireMonth': 1, 'expireYear': 2030}),
+            (Product, {'name': 'A'}),
+            (Purchase, {'purchasePrice': 1.0, 'paymentMethodId': 1}),
+        ]
+        for klass, data in casos:
+            with self.subTest(klass=klass.__name__):
+                with self.assertRaises(ValueError):
+                    klass.from_dict(data)
+
+    def test_deserialize_nested_model_list(self):
+        """_deserialize construye modelos anidados en listas"""
+        errores = util._deserialize([{'code': '400', 'message': 'a'},
+                                     {'code': '500', 'message': 'b'}], List[Error])
+        self.assertEqual(errores, [Error(code='400', message='a'), Error(code='500', message='b')])
+        with self.assertRaises(ValueError):
+            util._deserialize([{'code': '400'}], List[Error])
+
+    def test_from_dict_nested_model(self):
+        """from_dict construye los modelos anidados con su constructor"""
+        respuesta = _Respuesta.from_dict({'error': {'code': '404', 'message': 'a'},
+                                          'errores': [{'code': '500', 'message': 'b'}]})
+        self.assertEqual(respuesta.error, Error(code='404', message='a'))
+        self.assertEqual(respuesta.errores, [Error(code='500', message='b')])
+        self.assertEqual(respuesta.to_dict(), {'error': {'code': '404', 'message': 'a'},
+                                               'errores': [{'code': '500', 'message': 'b'}]})
+        with self.assertRaises(ValueError):
+            _Respuesta.from_dict({'error': {'code': '404'}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,6 @@ os.environ['TESTING'] = 'true'  # Activar modo test antes de importar
 from unittest.mock import patch
 
 from flask import json
-from six import BytesIO
 
 from swagger_server.models.error import Error  # noqa: E501
 from swagger_server.models.payment_method import PaymentMethod  # noqa: E501
@@ -47,6 +46,28 @@ class TestPaymentController(BaseTestCase):
         
         self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
 
+    @patch('swagger_server.controllers.authorization_controller.is_valid_token')
+    @patch('swagger_server.controllers.payment_controller.dbConectar')
+    def test_add_payment_method_invalid_month(self, mock_db, mock_token):
+        """Test case for add_payment_method with expireMonth out of range
+
+        Verifica que un mes fuera de 1..12 se rechaza con 400 sin tocar la BD.
+        """
+        mock_token.return_value = {'userId': 1}
+        self.client.set_cookie('localhost', 'oversound_auth', 'test_token_123')
+
+        for mes in (0, 13):
+            with self.subTest(mes=mes):
+                response = self.client.open(
+                    '/payment',
+                    method='POST',
+                    data=json.dumps({'cardNumber': '1234567812345678', 'expireMonth': mes,
+                                     'expireYear': 2030, 'cardHolder': 'John Doe'}),
+                    content_type='application/json'
+                )
+                self.assert400(response, 'Response body is : ' + response.data.decode('utf-8'))
+        mock_db.assert_not_called()
+
     @patch('swagger_server.controllers.payment_controller.dbConectar')
     def test_delete_payment_method(self, mock_db):
         """Test case for delete_payment_method
@@ -68,12 +89,15 @@ class TestPaymentController(BaseTestCase):
         
         self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
 
+    @patch('swagger_server.controllers.authorization_controller.is_valid_token')
     @patch('swagger_server.controllers.payment_controller.dbConectar')
-    def test_show_user_payment_methods(self, mock_db):
+    def test_show_user_payment_methods(self, mock_db, mock_token):
         """Test case for show_user_payment_methods
         
         Verifica que se pueden listar los métodos de pago del usuario.
         """
+        mock_token.return_value = {'userId': 1}
+
         # Mock base de datos
         mock_conn = mock_db.return_value
         mock_cursor = mock_conn.cursor.return_value
@@ -88,6 +112,24 @@ class TestPaymentController(BaseTestCase):
         )
         
         self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        self.assertEqual(response.headers.get('Cache-Control'), 'no-store')
+
+    @patch('swagger_server.controllers.authorization_controller.is_valid_token')
+    @patch('swagger_server.controllers.payment_controller.dbConectar')
+    def test_show_user_payment_methods_error_no_store(self, mock_db, mock_token):
+        """Test case for show_user_payment_methods without database
+
+        Verifica que las respuestas de error tampoco se pueden cachear.
+        """
+        mock_token.return_value = {'userId': 1}
+        mock_db.return_value = None
+
+        self.client.set_cookie('localhost', 'oversound_auth', 'test_token_123')
+
+        response = self.client.open('/payment', method='GET')
+
+        self.assertStatus(response, 503)
+        self.assertEqual(response.headers.get('Cache-Control'), 'no-store')
 
 
 if __name__ == '__main__':
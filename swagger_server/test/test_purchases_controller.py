@@ -13,7 +13,6 @@ if not hasattr(collections, 'Callable'):
 from unittest.mock import patch
 
 from flask import json
-from six import BytesIO
 
 from swagger_server.models.error import Error  # noqa: E501
 from swagger_server.models.purchase import Purchase  # noqa: E501
@@ -65,6 +64,33 @@ class TestPurchasesController(BaseTestCase):
         
         self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
 
+    @patch('swagger_server.controllers.authorization_controller.is_valid_token')
+    def test_set_purchase_id_out_of_range(self, mock_token):
+        """Test case for set_purchase with an ID outside int32
+
+        Verifica que un ID que no cabe en un entero de 32 bits devuelve 400.
+        """
+        mock_token.return_value = {'userId': 1}
+        body = {
+            'purchasePrice': 19.99,
+            'purchaseDate': '2025-11-16T10:00:00Z',
+            'paymentMethodId': 1,
+            'songIds': [2 ** 31],
+            'albumIds': [],
+            'merchIds': []
+        }
+
+        self.client.set_cookie('localhost', 'oversound_auth', 'test_token_123')
+
+        response = self.client.open(
+            '/purchase',
+            method='POST',
+            data=json.dumps(body),
+            content_type='application/json'
+        )
+
+        self.assert400(response, 'Response body is : ' + response.data.decode('utf-8'))
+
     def test_purchase_without_auth(self):
         """Test case for purchase without authentication
         
@@ -4,71 +4,102 @@ from __future__ import absolute_import
 import os
 os.environ['TESTING'] = 'true'  # Activar modo test antes de importar
 
-from unittest.mock import patch, MagicMock
+import threading
+import time
+from typing import NamedTuple
+from unittest.mock import patch
+from urllib.parse import urlparse
 
-from flask import json
-from six import BytesIO
+import orjson
 
+from swagger_server import covers
+from swagger_server.controllers import store_controller
 from swagger_server.models.error import Error  # noqa: E501
 from swagger_server.models.product import Product  # noqa: E501
 from swagger_server.test import BaseTestCase
 
+class FakeResp(NamedTuple):
+    """Respuesta mínima de TyA: el controlador solo lee ok y content."""
+    ok: bool
+    content: bytes = b''
+
+
+# Fixtures de TyA para test_show_storefront_products: se construyen y
+# serializan una sola vez al importar el módulo
+_FILTER_FIXTURE = [
+    {"songId": 1},
+    {"songId": 2}
+]
+
+_LIST_FIXTURE = [
+    {
+        "songId": 1,
+        "title": "Test Song 1",
+        "artistId": 1,
+        "albumId": 1,
+        "price": 1.99,
+        "description": "Test",
+        "releaseDate": "2024-01-01",
+        "duration": 180,
+        "cover": "base64...",
+        "genres": [1],
+        "collaborators": []
+    },
+    {
+        "songId": 2,
+        "title": "Test Song 2",
+        "artistId": 1,
+        "albumId": 1,
+        "price": 2.99,
+        "description": "Test",
+        "releaseDate": "2024-01-01",
+        "duration": 200,
+        "cover": "base64...",
+        "genres": [1],
+        "collaborators": []
+    }
+]
+
+_RESPUESTA_FILTER = FakeResp(True, orjson.dumps(_FILTER_FIXTURE))
+_RESPUESTA_LIST = FakeResp(True, orjson.dumps(_LIST_FIXTURE))
+
+# Una canción con portada en base64 (cabecera PNG) para los tests de portadas
+_PORTADA = "data:image/png;base64,iVBORw0KGgo="
+_RESPUESTA_LIST_PORTADA = FakeResp(True, orjson.dumps([
+    {"songId": 1, "title": "Test Song", "price": 1.99, "cover": _PORTADA}
+]))
+
+
+def _tya_con_portada(url, *args, **kwargs):
+    """side_effect de TyA con una sola canción que tiene portada."""
+    if url.endswith('/song/filter'):
+        return FakeResp(True, b'[1]')
+    if '/song/list' in url:
+        return _RESPUESTA_LIST_PORTADA
+    return FakeResp(True, b'[]')
+
+
 class TestStoreController(BaseTestCase):
     """StoreController integration test stubs"""
 
-    @patch('swagger_server.controllers.store_controller.requests.get')
+    def setUp(self):
+        # El catálogo se cachea entre peticiones: cada test parte sin caché
+        store_controller.invalidar_catalogo()
+
+    @patch('swagger_server.controllers.store_controller._SESION_TYA.get')
     def test_show_storefront_products(self, mock_get):
         """Test case for show_storefront_products
         
         Verifica que el endpoint /store retorna productos paginados
         desde el microservicio TyA.
         """
-        # Mock de las respuestas del microservicio TyA
-        mock_response_filter = MagicMock()
-        mock_response_filter.ok = True
-        mock_response_filter.json.return_value = [
-            {"songId": 1},
-            {"songId": 2}
-        ]
-        
-        mock_response_list = MagicMock()
-        mock_response_list.ok = True
-        mock_response_list.json.return_value = [
-            {
-                "songId": 1,
-                "title": "Test Song 1",
-                "artistId": 1,
-                "albumId": 1,
-                "price": 1.99,
-                "description": "Test",
-                "releaseDate": "2024-01-01",
-                "duration": 180,
-                "cover": "base64...",
-                "genres": [1],
-                "collaborators": []
-            },
-            {
-                "songId": 2,
-                "title": "Test Song 2",
-                "artistId": 1,
-                "albumId": 1,
-                "price": 2.99,
-                "description": "Test",
-                "releaseDate": "2024-01-01",
-                "duration": 200,
-                "cover": "base64...",
-                "genres": [1],
-                "collaborators": []
-            }
-        ]
-        
-        # Configurar mock para retornar diferentes respuestas según la URL
+        # Configurar mock para retornar diferentes respuestas según la URL:
+        # tabla indexada por el último segmento de la ruta
+        rutas = {'filter': _RESPUESTA_FILTER, 'list': _RESPUESTA_LIST}
+        sin_respuesta = FakeResp(False)
+
         def side_effect(url, *args, **kwargs):
-            if 'filter' in url:
-                return mock_response_filter
-            elif 'list' in url:
-                return mock_response_list
-            return MagicMock(ok=False)
+            return rutas.get(urlparse(url).path.rpartition('/')[2], sin_respuesta)
         
         mock_get.side_effect = side_effect
         
@@ -81,15 +112,213 @@ class TestStoreController(BaseTestCase):
         # Verificaciones
         self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
         
-        data = json.loads(response.data.decode('utf-8'))
+        data = orjson.loads(response.data)
         
         # Verificar estructura de paginación
-        self.assertIn('data', data)
-        self.assertIn('pagination', data)
-        self.assertIn('page', data['pagination'])
-        self.assertIn('limit', data['pagination'])
-        self.assertIn('total', data['pagination'])
-        self.assertIn('totalPages', data['pagination'])
+        self.assertGreaterEqual(data.keys(), {'data', 'pagination'})
+        self.assertGreaterEqual(data['pagination'].keys(), {'page', 'limit', 'total', 'totalPages'})
+
+
+    @patch('swagger_server.controllers.store_controller._SESION_TYA.get')
+    def test_show_storefront_products_cached(self, mock_get):
+        """Test case for show_storefront_products
+
+        Verifica que una segunda petición a /store se sirve desde la caché
+        sin volver a consultar el microservicio TyA.
+        """
+        mock_get.return_value = FakeResp(True, b'[]')
+
+        response = self.client.open('/store', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        llamadas = mock_get.call_count
+
+        response = self.client.open('/store', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        self.assertEqual(mock_get.call_count, llamadas)
+
+    @patch('swagger_server.controllers.store_controller._SESION_TYA.get')
+    def test_show_storefront_products_error_not_cached(self, mock_get):
+        """Test case for show_storefront_products
+
+        Verifica que si TyA responde con error a un /filter el catálogo
+        (incompleto) no se cachea y la siguiente petición vuelve a consultar TyA.
+        """
+        def side_effect(url, *args, **kwargs):
+            if url.endswith('/song/filter'):
+                return FakeResp(False)
+            return FakeResp(True, b'[]')
+
+        mock_get.side_effect = side_effect
+
+        response = self.client.open('/store', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        llamadas = mock_get.call_count
+
+        response = self.client.open('/store', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        self.assertGreater(mock_get.call_count, llamadas)
+
+    @patch('swagger_server.controllers.store_controller._consultar_catalogo')
+    def test_catalog_cold_load_single_flight(self, mock_consultar):
+        """Test case for _obtener_catalogo
+
+        Verifica que sin catálogo en caché varias peticiones simultáneas
+        provocan una sola consulta a TyA.
+        """
+        def consultar():
+            time.sleep(0.1)
+            return {"productos": [], "genres": [], "artists": []}, True
+
+        mock_consultar.side_effect = consultar
+        catalogos = []
+        hilos = [threading.Thread(target=lambda: catalogos.append(store_controller._obtener_catalogo()))
+                 for _ in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(mock_consultar.call_count, 1)
+        self.assertEqual(len(catalogos), 4)
+        self.assertTrue(all(catalogo is catalogos[0] for catalogo in catalogos))
+
+    @patch('swagger_server.controllers.store_controller._SESION_TYA.get')
+    def test_show_storefront_products_not_modified(self, mock_get):
+        """Test case for show_storefront_products
+
+        Verifica que /store emite un ETag y responde 304 sin cuerpo cuando
+        el cliente envía ese mismo ETag en If-None-Match.
+        """
+        mock_get.return_value = FakeResp(True, b'[]')
+
+        response = self.client.open('/store', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        etag = response.headers['ETag']
+        self.assertIn('Cache-Control', response.headers)
+
+        response = self.client.open('/store', method='GET', headers={'If-None-Match': etag})
+        self.assertStatus(response, 304)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+
+    @patch('swagger_server.controllers.store_controller._SESION_TYA.get')
+    def test_show_storefront_products_include_cover(self, mock_get):
+        """Test case for show_storefront_products
+
+        Verifica que /store devuelve las portadas como URL y que con
+        include=cover las incrusta en base64.
+        """
+        mock_get.side_effect = _tya_con_portada
+
+        response = self.client.open('/store', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        self.assertTrue(orjson.loads(response.data)['data'][0]['cover'].startswith('/store/covers/'))
+
+        response = self.client.open('/store?include=cover', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        self.assertEqual(orjson.loads(response.data)['data'][0]['cover'], _PORTADA)
+
+    @patch('swagger_server.controllers.store_controller._SESION_TYA.get')
+    def test_show_storefront_products_include_cover_missing(self, mock_get):
+        """Test case for show_storefront_products
+
+        Verifica que con include=cover una portada que ya no está en el
+        catálogo da un error en lugar de enviar la URL como si fuera la imagen.
+        """
+        mock_get.side_effect = _tya_con_portada
+
+        response = self.client.open('/store', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        store_controller._obtener_catalogo()["portadas"].clear()
+
+        response = self.client.open('/store?include=cover', method='GET')
+        self.assert500(response)
+        self.assertEqual(orjson.loads(response.data)['message'], 'Portada no disponible')
+
+    def test_portada_en_linea_missing(self):
+        """portada_en_linea no retorna la URL de una portada ausente"""
+        url = covers.registrar_portada(_PORTADA, {})
+        with self.assertRaises(KeyError):
+            covers.portada_en_linea(url, {})
+
+    @patch('swagger_server.controllers.store_controller._SESION_TYA.get')
+    def test_show_storefront_products_cover_not_cached(self, mock_get):
+        """Test case for show_storefront_products
+
+        Verifica que si el catálogo no se puede cachear (algún fallo de TyA)
+        las portadas se envían incrustadas en lugar de como URL.
+        """
+        def side_effect(url, *args, **kwargs):
+            if url.endswith('/album/filter'):
+                return FakeResp(False)
+            return _tya_con_portada(url)
+
+        mock_get.side_effect = side_effect
+
+        response = self.client.open('/store', method='GET')
+        self.assert200(response, 'Response body is : ' + response.data.decode('utf-8'))
+        self.assertEqual(orjson.loads(response.data)['data'][0]['cover'], _PORTADA)
+
+    @patch('swagger_server.controllers.store_controller._SESION_TYA.get')
+    def test_get_store_cover(self, mock_get):
+        """Test case for get_store_cover
+
+        Verifica que una portada publicada por el catálogo se sirve como
+        imagen cacheable, también tras descartarse el catálogo en caché
+        (como en otro worker o tras reiniciar), y que una desconocida
+        retorna 404.
+        """
+        mock_get.side_effect = _tya_con_portada
+
+        response = self.client.open('/store', method='GET')
+        url = orjson.loads(response.data)['data'][0]['cover']
+        self.assertTrue(url.startswith('/store/covers/'))
+
+        response = self.client.open(url, method='GET')
+        self.assert200(response)
+        self.assertEqual(response.mimetype, 'image/png')
+        self.assertEqual(response.data, b'\x89PNG\r\n\x1a\n')
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        self.assertEqual(response.headers['X-Content-Type-Options'], 'nosniff')
+
+        store_controller.invalidar_catalogo()
+        response = self.client.open(url, method='GET')
+        self.assert200(response)
+        self.assertEqual(response.data, b'\x89PNG\r\n\x1a\n')
+
+        response = self.client.open('/store/covers/0000000000000000', method='GET')
+        self.assert404(response)
+
+    @patch('swagger_server.controllers.store_controller._obtener_catalogo')
+    def test_show_storefront_products_serialization_error(self, mock_catalogo):
+        """Test case for show_storefront_products
+
+        Verifica que un fallo al serializar la página se responde con un
+        Error 500 completo en lugar de un 200 truncado.
+        """
+        mock_catalogo.return_value = {
+            "productos": [{"songId": 1}, {"songId": 2, "cover": object()}],
+            "genres": [],
+            "artists": [],
+            "portadas": {},
+            "version": "v"
+        }
+
+        response = self.client.open('/store', method='GET')
+        self.assert500(response)
+        self.assertEqual(orjson.loads(response.data)['code'], '500')
+
+    def test_get_store_cover_only_images(self):
+        """Test case for get_store_cover
+
+        Verifica que un data URI que no es una imagen rasterizada no se
+        registra para servirse desde /store/covers y se deja sin cambios.
+        """
+        portadas = {}
+        for portada in ("data:text/html;base64,PHNjcmlwdD48L3NjcmlwdD4=",
+                        "data:image/svg+xml;base64,PHN2Zz48L3N2Zz4="):
+            self.assertEqual(covers.registrar_portada(portada, portadas), portada)
+        self.assertEqual(portadas, {})
 
 
 if __name__ == '__main__':
@@ -1,4 +1,6 @@
 import datetime
+import functools
+from array import array
 
 import six
 import typing
@@ -51,6 +53,134 @@ def _deserialize_primitive(data, klass):
     return value
 
 
+def deserialize_primitive(data, klass):
+    """Deserializes a single primitive value without going through _deserialize.
+
+    Values that already have the exact type (the usual case for JSON bodies)
+    are returned as-is; anything else is converted like _deserialize_primitive.
+
+    :param data: value to deserialize.
+    :param klass: int, float, str or bool.
+    :return: int, float, str, bool or None.
+    """
+    if data is None or type(data) is klass:
+        return data
+    return _deserialize_primitive(data, klass)
+
+
+def deserialize_primitive_list(data, klass):
+    """Deserializes a list of primitive values with deserialize_primitive.
+
+    :param data: list to deserialize.
+    :param klass: type of the elements.
+    :return: deserialized list or None.
+    """
+    if data is None:
+        return None
+    return [deserialize_primitive(sub_data, klass) for sub_data in data]
+
+
+def compile_from_dict(klass):
+    """Generates a from_dict specialized for the fixed fields of a model.
+
+    The source is built once from klass.swagger_types/attribute_map and
+    compiled with exec: the resulting function reads every JSON key with a
+    straight-line dikt.get and passes the converted values to the
+    constructor as keyword arguments, so no type dispatch happens per call
+    and the constructor's own validation still applies.
+
+    :param klass: model class whose __init__ takes every swagger_types field.
+    :return: classmethod to assign as klass.from_dict.
+    """
+    namespace = {
+        '_deserialize': _deserialize,
+        '_deserialize_primitive': _deserialize_primitive,
+        'deserialize_primitive_list': deserialize_primitive_list,
+        'deserialize_date': deserialize_date,
+        'deserialize_datetime': deserialize_datetime,
+    }
+    lines = []
+    for i, (attr, attr_type) in enumerate(klass.swagger_types.items()):
+        key = repr(klass.attribute_map[attr])
+        namespace['_t%d' % i] = attr_type
+        if attr_type in six.integer_types or attr_type in (float, str, bool):
+            expr = ('_v%d if (_v%d := get(%s)) is None or type(_v%d) is _t%d'
+                    ' else _deserialize_primitive(_v%d, _t%d)' % (i, i, key, i, i, i, i))
+        elif type_util.is_generic(attr_type) and type_util.is_list(attr_type) \
+                and attr_type.__args__[0] in six.integer_types + (float, str, bool):
+            namespace['_t%d' % i] = attr_type.__args__[0]
+            expr = 'deserialize_primitive_list(get(%s), _t%d)' % (key, i)
+        elif attr_type == datetime.datetime:
+            expr = 'None if (_v%d := get(%s)) is None else deserialize_datetime(_v%d)' % (i, key, i)
+        elif attr_type == datetime.date:
+            expr = 'None if (_v%d := get(%s)) is None else deserialize_date(_v%d)' % (i, key, i)
+        else:
+            expr = '_deserialize(get(%s), _t%d)' % (key, i)
+        lines.append('        %s=%s,' % (attr, expr))
+
+    source = ('def from_dict(cls, dikt):\n'
+              '    if not isinstance(dikt, dict):\n'
+              '        dikt = {}\n'
+              '    get = dikt.get\n'
+              '    return cls(\n%s\n    )\n' % '\n'.join(lines))
+    exec(compile(source, '<from_dict %s>' % klass.__name__, 'exec'), namespace)
+    from_dict = namespace['from_dict']
+    from_dict.__qualname__ = '%s.from_dict' % klass.__name__
+    from_dict.__module__ = klass.__module__
+    from_dict.__doc__ = 'Returns the dict as a %s (generated by util.compile_from_dict).' % klass.__name__
+    return classmethod(from_dict)
+
+
+def serialize_value(value):
+    """Converts a model attribute value the way Model.to_dict does.
+
+    Nested models become dicts, also inside lists and dict values, and
+    tuples and arrays become lists; any other value is returned unchanged.
+
+    :param value: attribute value.
+    :return: serialized value.
+    """
+    if isinstance(value, (list, tuple)):
+        return [x.to_dict() if hasattr(x, 'to_dict') else x for x in value]
+    if isinstance(value, array):
+        return value.tolist()
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {k: v.to_dict() if hasattr(v, 'to_dict') else v
+                for k, v in value.items()}
+    return value
+
+
+def compile_to_dict(klass):
+    """Generates a to_dict specialized for the fixed fields of a model.
+
+    Builds one dict literal with the attribute names as keys. Fields typed
+    as primitives, date or datetime are read directly; the rest go through
+    serialize_value, so the result matches Model.to_dict.
+
+    :param klass: model class with class-level swagger_types.
+    :return: function to assign as klass.to_dict.
+    """
+    direct = six.integer_types + (float, str, bool, datetime.date, datetime.datetime)
+    lines = []
+    for attr, attr_type in klass.swagger_types.items():
+        if attr_type in direct:
+            lines.append('        %r: self.%s,' % (attr, attr))
+        else:
+            lines.append('        %r: serialize_value(self.%s),' % (attr, attr))
+
+    source = ('def to_dict(self):\n'
+              '    return {\n%s\n    }\n' % '\n'.join(lines))
+    namespace = {'serialize_value': serialize_value}
+    exec(compile(source, '<to_dict %s>' % klass.__name__, 'exec'), namespace)
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = '%s.to_dict' % klass.__name__
+    to_dict.__module__ = klass.__module__
+    to_dict.__doc__ = 'Returns the model properties as a dict (generated by util.compile_to_dict).'
+    return to_dict
+
+
 def _deserialize_object(value):
     """Return an original value.
 
@@ -77,13 +207,39 @@ def deserialize_date(string):
 def deserialize_datetime(string):
     """Deserializes string to datetime.
 
-    The string should be in iso8601 datetime format.
+    The string should be in iso8601 datetime format. Values that already
+    are datetime objects (e.g. a Purchase built in code) are returned as-is.
+
+    :param string: str.
+    :type string: str
+    :return: datetime.
+    :rtype: datetime
+    """
+    if isinstance(string, datetime.datetime):
+        return string
+    return _parse_datetime(string)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_datetime(string):
+    """Parses an iso8601 string to datetime.
+
+    RFC 3339 strings are parsed with datetime.fromisoformat (a trailing 'Z'
+    is rewritten as '+00:00'); dateutil is only used for inputs
+    fromisoformat rejects. Results are memoized, since many products share
+    a release date.
 
     :param string: str.
     :type string: str
     :return: datetime.
     :rtype: datetime
     """
+    try:
+        if string.endswith('Z'):
+            return datetime.datetime.fromisoformat(string[:-1] + '+00:00')
+        return datetime.datetime.fromisoformat(string)
+    except ValueError:
+        pass
     try:
         from dateutil.parser import parse
         return parse(string)
@@ -91,27 +247,31 @@ def deserialize_datetime(string):
         return string
 
 
+@functools.lru_cache(maxsize=None)
+def _from_dict_for(klass):
+    """Returns compile_from_dict(klass) bound to klass, compiled once per class.
+
+    :param klass: model class with class-level swagger_types.
+    :return: function taking the dict.
+    """
+    return compile_from_dict(klass).__get__(None, klass)
+
+
 def deserialize_model(data, klass):
     """Deserializes list or dict to model.
 
+    Goes through the same generated code as the models' from_dict (see
+    compile_from_dict), so nested models (e.g. in a List[Model]) are built
+    through their constructor and keep its validation.
+
     :param data: dict, list.
     :type data: dict | list
     :param klass: class literal.
-    :return: model object.
+    :return: model object, or data unchanged if klass declares no fields.
     """
-    instance = klass()
-
-    if not instance.swagger_types:
+    if not klass.swagger_types:
         return data
-
-    for attr, attr_type in six.iteritems(instance.swagger_types):
-        if data is not None \
-                and instance.attribute_map[attr] in data \
-                and isinstance(data, (list, dict)):
-            value = data[instance.attribute_map[attr]]
-            setattr(instance, attr, _deserialize(value, attr_type))
-
-    return instance
+    return _from_dict_for(klass)(data)
 
 
 def _deserialize_list(data, boxed_type):